@@ -6,19 +6,60 @@ Extracts structured tool calls from LLM responses:
 - Tool name and argument extraction
 - Malformed output handling
 - Distinction between tool calls and final responses
+
+The LLM client requests structured `tool_calls` via llama.cpp function
+calling; this parser is the fallback for models that emit `<tool_call>` tags.
 """
-import json
-import re
-from typing import Optional
+from typing import Iterator, Optional
+
+import orjson
+
+_OPEN, _CLOSE = "<tool_call>", "</tool_call>"
+_OPEN_LEN, _CLOSE_LEN = len(_OPEN), len(_CLOSE)
+
+
+def _iter_tool_calls(llm_output: str) -> Iterator[dict]:
+    """Yield every `<tool_call>` block whose payload is valid JSON, in order."""
+    i = llm_output.find(_OPEN)
+    while i != -1:
+        start = i + _OPEN_LEN
+        j = llm_output.find(_CLOSE, start)
+        if j == -1:
+            break
+        payload = llm_output[start:j].strip()
+        try:
+            obj = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            obj = None
+        if isinstance(obj, dict):
+            yield {"tool_name": obj.get("name"), "arguments": obj.get("arguments", {})}
+        i = llm_output.find(_OPEN, j + _CLOSE_LEN)
+
 
 def parse_tool_call(llm_output: str) -> Optional[dict]:
     """
     Parse the LLM output to extract tool call information.
 
+    Scans for `<tool_call>...</tool_call>` blocks with `str.find` and returns
+    the first block whose payload is valid JSON. Malformed blocks are skipped.
+
     Args:
         llm_output (str): The raw output string from the LLM.
 
     Returns:
         Optional[dict]: A dictionary with 'tool_name' and 'arguments' if a tool call is found, else None.
     """
-    pass 
\ No newline at end of file
+    return next(_iter_tool_calls(llm_output), None)
+
+
+def parse_tool_calls(llm_output: str) -> list[dict]:
+    """
+    Parse every tool call in the LLM output.
+
+    Args:
+        llm_output (str): The raw output string from the LLM.
+
+    Returns:
+        list[dict]: One dictionary with 'tool_name' and 'arguments' per valid tool call.
+    """
+    return list(_iter_tool_calls(llm_output))
@@ -7,4 +7,15 @@ Contains all prompt engineering for the agent:
 - Output format specifications
 - Error handling guidance
 """
+from weave.core.registry import ToolRegistry
 
+TOOL_PROMPT_TEMPLATE = """You have access to the following tools:
+{tools}
+
+To call a tool, reply with a JSON object inside <tool_call></tool_call> tags:
+<tool_call>{{"name": "<tool name>", "arguments": {{"<argument>": "<value>"}}}}</tool_call>"""
+
+
+def build_tool_prompt(registry: ToolRegistry) -> str:
+    """Describe the registered tools for models without native function calling."""
+    return TOOL_PROMPT_TEMPLATE.format(tools=registry.as_openai_tools_json().decode())
@@ -10,4 +10,47 @@ The main agent loop that:
 
 Includes iteration limits and loop detection.
 """
+from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from weave.core.registry import ToolRegistry
+
+MAX_TOOL_CONCURRENCY = 8
+
+
+async def execute_tool_calls(
+    registry: ToolRegistry,
+    tool_calls: list[dict],
+    max_concurrency: int = MAX_TOOL_CONCURRENCY,
+) -> list[Any]:
+    """
+    Execute independent tool calls concurrently.
+
+    At most `max_concurrency` tools run at once so a burst of file operations
+    does not thrash the disk. A failing tool does not cancel the others; its
+    exception (or cancellation) is returned as an error string for the LLM
+    to reason about.
+
+    Args:
+        registry: Registry to dispatch the calls through
+        tool_calls: Parsed calls with 'tool_name' and 'arguments' keys
+        max_concurrency: Maximum number of tools running at the same time
+
+    Returns:
+        list: One result per tool call, in the same order as `tool_calls`
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(tool_call: dict) -> Any:
+        async with semaphore:
+            return await registry.aexecute(tool_call["tool_name"], tool_call["arguments"])
+
+    results = await asyncio.gather(*(run(tc) for tc in tool_calls), return_exceptions=True)
+    return [
+        f'Error executing tool "{tc["tool_name"]}": {result}'
+        if isinstance(result, BaseException) else result
+        for tc, result in zip(tool_calls, results)
+    ]
@@ -8,3 +8,83 @@ configuration values.
 Config file locations follow XDG base directory specification.
 """
 
+import functools
+import os
+import tomllib
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+
+def _xdg_dir(env_var: str, fallback: str) -> Path:
+    """Resolve an XDG base directory for weave, honouring the env override."""
+    base = os.environ.get(env_var)
+    return (Path(base) if base else Path.home() / fallback) / "weave"
+
+
+CONFIG_DIR = _xdg_dir("XDG_CONFIG_HOME", ".config")
+DATA_DIR = _xdg_dir("XDG_DATA_HOME", ".local/share")
+STATE_DIR = _xdg_dir("XDG_STATE_HOME", ".local/state")
+CONFIG_PATH = CONFIG_DIR / "config.toml"
+MODELS_DIR = DATA_DIR / "models"
+
+
+class LLMConfig(BaseModel):
+    """Settings used to load the local model."""
+    # None picks a quantization of the default model that suits the backend.
+    model_path: Path | None = None
+    n_ctx: int = 8192
+    # Map GGUF weights instead of copying them, and let the OS page them out.
+    use_mmap: bool = True
+    use_mlock: bool = False
+    # None uses the physical cores for decoding and every logical core for
+    # prompt prefill, which is compute-bound and still gains from SMT.
+    n_threads: int | None = None
+    n_threads_batch: int | None = None
+    # None offloads every layer when llama.cpp was built with GPU support.
+    n_gpu_layers: int | None = None
+    n_batch: int = 512
+    offload_kqv: bool = True
+    flash_attn: bool = False
+    chat_format: str = "chatml-function-calling"
+    # KV state kept for reuse across turns that share a prompt prefix; 0 disables it.
+    prompt_cache_bytes: int = 2 * 1024**3
+    # Keep that state on disk instead, so conversations resume without prefill after a restart.
+    prompt_cache_dir: Path | None = None
+    # Reuse replies to near-identical questions; needs the `memory` extra.
+    semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.95
+
+
+class LoggingConfig(BaseModel):
+    """Settings for the application log file."""
+    level: str = "INFO"
+    file: Path = STATE_DIR / "weave.log"
+
+
+class Config(BaseModel):
+    """Top-level weave configuration."""
+    llm: LLMConfig = LLMConfig()
+    logging: LoggingConfig = LoggingConfig()
+
+
+def load_config(path: Path = CONFIG_PATH) -> Config:
+    """Load configuration from a TOML file.
+
+    Returns the defaults if the file does not exist.
+    """
+    if not path.exists():
+        return Config()
+
+    with path.open("rb") as config_file:
+        content = tomllib.load(config_file)
+    try:
+        return Config(**content)
+    except ValidationError as exc:
+        raise ValueError(f"Invalid config file {path}: {exc}") from exc
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the user configuration, loading it on first use."""
+    return load_config()
@@ -9,12 +9,22 @@ Configures application-wide logging with support for:
 """
 
 import logging
+import os
+from logging.handlers import RotatingFileHandler
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename="/home/bamiboy/projects/weave/weave.log"
+from weave.core.config import get_config
 
-)
+# Don't stack handlers when the module is re-imported (tests, reloads).
+if not logging.getLogger().handlers:
+    _config = get_config().logging
+    _log_file = _config.file.expanduser()
+    _log_file.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=os.environ.get("WEAVE_LOG_LEVEL", _config.level).upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            RotatingFileHandler(_log_file, maxBytes=10_000_000, backupCount=3, delay=True)
+        ],
+    )
 
-logger = logging.getLogger(__name__)
\ No newline at end of file
+logger = logging.getLogger(__name__)
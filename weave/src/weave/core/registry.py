@@ -8,47 +8,65 @@ The registry:
 - Validates arguments against schemas before execution
 - Handles tool discovery at startup
 """
+import asyncio
+from collections import namedtuple
+
+import orjson
 from weave.tools.schema import ToolSchema
 from typing import Callable, Optional, Any
 
+# A registered tool: its implementation and schema, looked up together.
+_Entry = namedtuple("_Entry", "func schema")
+
+
 class ToolRegistry:
     def __init__(self):
-        self.tools = {}
-        self.schemas  = {}
+        self._entries: dict[str, _Entry] = {}
+        self._tools_cache: list[dict] | None = None
+        self._tools_json_cache: bytes | None = None
 
     def register(self, schema: ToolSchema) -> Callable:
         """Decorator to register a tool with its schema."""
         def decorator(func):
-            self.tools[schema.name] = func
-            self.schemas[schema.name] = schema
+            self._entries[schema.name] = _Entry(func, schema)
+            self._tools_cache = None
+            self._tools_json_cache = None
             return func
         return decorator
 
-    def get_schema(self, name: str) -> ToolSchema | None:
+    def get_schema(self, name: str) -> ToolSchema:
         """Get schema for a tool."""
-        schema = (self.schemas).get(name)
-        if schema is None:
-            raise KeyError(f'Schema "{name}" not found in registry')
-        return schema
+        try:
+            return self._entries[name].schema
+        except KeyError:
+            raise KeyError(f'Schema "{name}" not found in registry') from None
 
     def get_all_schemas(self) -> list[ToolSchema]:
         """Get all registered tool schemas."""
-        return list(self.schemas.values())
+        return [entry.schema for entry in self._entries.values()]
 
     def get_tools(self) -> list[dict]:
-        """Get all registered tools as dicts with name and schema."""
-        return [
-            {
-                "type": "function",
-                "function": schema.to_json_schema(),
-            }
-            for schema in self.get_all_schemas()
-        ]
-        
+        """Get all registered tools as OpenAI-style function specs.
+
+        The list is built once and shared until the next register; don't mutate it.
+        """
+        if self._tools_cache is None:
+            self._tools_cache = [schema.json_schema for schema in self.get_all_schemas()]
+        return self._tools_cache
+
+    def as_openai_tools_json(self) -> bytes:
+        """Get the tool specs serialized as JSON, cached until the next register."""
+        if self._tools_json_cache is None:
+            self._tools_json_cache = orjson.dumps(self.get_tools())
+        return self._tools_json_cache
 
     def execute(self, name: str, args: dict) -> Optional[Any]:
         """Execute a registered tool."""
-        if name not in self.tools:
+        entry = self._entries.get(name)
+        if entry is None:
             raise ValueError(f'Tool "{name}" not found in registry')
-        tool = self.tools[name]
-        return tool(**args)
\ No newline at end of file
+        return entry.func(**args)
+
+    async def aexecute(self, name: str, args: dict) -> Optional[Any]:
+        """Execute a registered tool in a worker thread."""
+        return await asyncio.to_thread(self.execute, name, args)
@@ -0,0 +1,98 @@
+"""
+Semantic response cache.
+
+Skips inference for questions that were already answered:
+- Lookup by embedding similarity of the latest user message
+- Exact match on the preceding conversation (system prompt + history)
+- LRU eviction and time-based expiry
+- Bypass for time-sensitive questions
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Sequence
+
+import orjson
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from weave.memory.semantic import load_embedding_model
+from weave.tui.models import MessageContent
+
+# Answers to these depend on when they are asked, so they are never cached.
+_TIME_SENSITIVE = re.compile(
+    r"\b(now|today|tonight|yesterday|tomorrow|current(ly)?|latest)\b", re.IGNORECASE
+)
+
+
+class PromptCache:
+    """In-memory cache of text replies, keyed by conversation prefix and question meaning."""
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256, ttl: float = 3600.0) -> None:
+        if np is None:
+            raise ImportError("The semantic cache needs the 'memory' extra: pip install 'weave[memory]'")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, int], tuple[object, str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @staticmethod
+    def _split(messages: Sequence[MessageContent]) -> tuple[str, str] | None:
+        """Return (prefix hash, question), or None if the request is not cacheable."""
+        if not messages or messages[-1].get("role") != "user":
+            return None
+        question = messages[-1].get("content", "")
+        if not question or _TIME_SENSITIVE.search(question):
+            return None
+        prefix = hashlib.blake2b(orjson.dumps(list(messages[:-1])), digest_size=16).hexdigest()
+        return prefix, question
+
+    @staticmethod
+    def _embed(text: str):
+        return load_embedding_model().encode([text], normalize_embeddings=True, convert_to_numpy=True)[0]
+
+    def lookup(self, messages: Sequence[MessageContent]) -> str | None:
+        """Return a cached reply for a near-identical question in the same context."""
+        key = self._split(messages)
+        if key is None:
+            return None
+        prefix, question = key
+        with self._lock:
+            now = time.monotonic()
+            for entry_key in [k for k, (_, _, t) in self._entries.items() if now - t > self.ttl]:
+                del self._entries[entry_key]
+            candidates = [(k, v) for k, v in self._entries.items() if k[0] == prefix]
+        if not candidates:
+            return None
+
+        query = self._embed(question)
+        scores = np.stack([vector for _, (vector, _, _) in candidates]) @ query
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None
+        entry_key, (_, response, _) = candidates[best]
+        with self._lock:
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+        return response
+
+    def store(self, messages: Sequence[MessageContent], response: str) -> None:
+        """Remember the reply to the latest user message."""
+        key = self._split(messages)
+        if key is None or not response:
+            return
+        prefix, question = key
+        vector = self._embed(question)
+        with self._lock:
+            self._entries[(prefix, self._next_id)] = (vector, response, time.monotonic())
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
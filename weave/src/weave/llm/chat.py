@@ -15,6 +15,21 @@ from typing import Sequence, cast
 
 def format_messages_for_llm(messages: Sequence[ChatMessage | MessageContent]) -> list[MessageContent]:
     """Format messages for LLM consumption."""
+    if not messages:
+        return []
+    # Lists are homogeneous in practice, so dispatch on the first message and
+    # only fall back to per-message checks if the list turns out to be mixed.
+    try:
+        if isinstance(messages[0], ChatMessage):
+            chat_messages = cast(Sequence[ChatMessage], messages)
+            return [{"role": m.role, "content": m.content} for m in chat_messages]  # type: ignore[typeddict-item]
+        dict_messages = cast(Sequence[MessageContent], messages)
+        return [
+            {"role": m.get("role", "user"), "content": m.get("content", "")}  # type: ignore[typeddict-item]
+            for m in dict_messages
+        ]
+    except AttributeError:
+        pass
     formatted: list[MessageContent] = []
     for msg in messages:
         if isinstance(msg, ChatMessage):
@@ -25,4 +40,4 @@ def format_messages_for_llm(messages: Sequence[ChatMessage | MessageContent]) ->
             role = msg.get("role", "user")
             content = msg.get("content", "")
         formatted.append({"role": role, "content": content})  # type: ignore[typeddict-item]
-    return formatted
\ No newline at end of file
+    return formatted
@@ -10,11 +10,19 @@ Handles model loading with appropriate settings:
 Provides a clean interface for the rest of the application.
 """
 
-from llama_cpp import Llama
-import sys
+from llama_cpp import Llama, LlamaDiskCache, LlamaRAMCache, LogitsProcessorList, llama_supports_gpu_offload
+import asyncio
+import contextlib
+import functools
 import os
-from typing import Generator, Sequence
+import threading
+from pathlib import Path
+from typing import AsyncIterator, Generator, Sequence, cast
+
+import orjson
+from weave.core.config import MODELS_DIR, get_config
 from weave.core.logging import logger
+from weave.llm.cache import PromptCache
 from weave.tui.models import MessageContent
 from llama_cpp.llama_types import ChatCompletionRequestMessage, ChatCompletionTool
 from weave.tools import registry as tool_registry
@@ -22,32 +30,185 @@ from weave.tools import registry as tool_registry
 
 
 
-# supppress stderr from llama.cpp
-sys.stderr = open(os.devnull, 'w')
+def _physical_core_count() -> int:
+    """Count physical cores, since SMT siblings don't speed up llama.cpp matmuls."""
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+    return count or max(1, (os.cpu_count() or 2) // 2)
+
+
+def _gpu_layers(configured: int | None) -> int:
+    """Resolve how many layers to offload: env override, then config, then auto-detect."""
+    if "WEAVE_GPU_LAYERS" in os.environ:
+        return int(os.environ["WEAVE_GPU_LAYERS"])
+    if configured is not None:
+        return configured
+    return -1 if llama_supports_gpu_offload() else 0
+
+
+DEFAULT_MODEL = "qwen2.5-coder-1.5b-instruct"
+# Preferred quantizations of DEFAULT_MODEL, best first.
+GPU_QUANTS = ("q8_0", "q5_k_m", "q4_k_m")
+CPU_QUANTS = ("q5_k_m", "q4_k_m")
+
+
+def _model_path(configured: Path | None, gpu: bool) -> Path:
+    """Resolve the model file: env override, then config, then the best downloaded quantization."""
+    if "WEAVE_MODEL_PATH" in os.environ:
+        return Path(os.environ["WEAVE_MODEL_PATH"]).expanduser()
+    if configured is not None:
+        return configured.expanduser()
+    candidates = [MODELS_DIR / f"{DEFAULT_MODEL}-{quant}.gguf" for quant in (GPU_QUANTS if gpu else CPU_QUANTS)]
+    # Fall back to the preferred file so the load error names what to download.
+    return next((path for path in candidates if path.exists()), candidates[0])
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm() -> Llama:
+    """Load the model on first use and reuse it for every later call."""
+    config = get_config().llm
+    physical_cores = _physical_core_count()
+    n_gpu_layers = _gpu_layers(config.n_gpu_layers)
+    model_path = _model_path(config.model_path, gpu=n_gpu_layers != 0)
+    logger.info("Loading %s (%s layers on GPU)", model_path.name, "all" if n_gpu_layers < 0 else n_gpu_layers)
+    # suppress stderr from llama.cpp during model load only
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        llm = Llama(
+            model_path=str(model_path),
+            n_ctx=int(os.environ.get("WEAVE_N_CTX", config.n_ctx)),
+            use_mmap=config.use_mmap,
+            use_mlock=config.use_mlock,
+            n_threads=config.n_threads or physical_cores,
+            n_threads_batch=config.n_threads_batch or os.cpu_count() or physical_cores,
+            n_gpu_layers=n_gpu_layers,
+            n_batch=config.n_batch,
+            offload_kqv=config.offload_kqv,
+            flash_attn=config.flash_attn,
+            verbose=False,
+            chat_format=config.chat_format,
+        )
+    if config.prompt_cache_bytes:
+        # The KV state is snapshotted at the end of every turn, keyed by its tokens,
+        # and the longest matching prefix is restored on the next call. Follow-up
+        # turns and switches back to an earlier chat only prefill the new suffix.
+        if config.prompt_cache_dir is not None:
+            cache = LlamaDiskCache(
+                cache_dir=str(config.prompt_cache_dir.expanduser()),
+                capacity_bytes=config.prompt_cache_bytes,
+            )
+        else:
+            cache = LlamaRAMCache(capacity_bytes=config.prompt_cache_bytes)
+        llm.set_cache(cache)
+    logger.info("LLM model loaded successfully")
+    logger.debug("Model path: %s", llm.model_path)
+    return llm
+
+
+@functools.lru_cache(maxsize=1)
+def _get_prompt_cache() -> PromptCache | None:
+    """Build the semantic prompt cache if it is enabled in the config."""
+    config = get_config().llm
+    if not config.semantic_cache:
+        return None
+    try:
+        return PromptCache(threshold=config.semantic_cache_threshold)
+    except ImportError as e:
+        logger.warning("Semantic cache disabled: %s", e)
+        return None
+
+
+def _cancel_processor(llm: Llama, cancel: threading.Event) -> LogitsProcessorList:
+    """Force end-of-sequence once `cancel` is set so decoding stops at the next token."""
+    eos = llm.token_eos()
+
+    def processor(input_ids, scores):
+        if cancel.is_set():
+            scores.fill(float("-inf"))
+            scores[eos] = 0.0
+        return scores
+
+    return LogitsProcessorList([processor])
 
-llm = Llama(
-    model_path="/home/bamiboy/projects/weave/models/qwen2.5-coder-1.5b-instruct-q4_k_m.gguf",
-    n_ctx=8192,
-    n_threads=4,
-    n_gpu_layers=0,
-    verbose=False,
-    chat_format="qwen"
-)
-logger.info("LLM model loaded successfully")
-logger.debug(f"Model path: {llm.model_path}")
 
 def _convert_messages(messages: Sequence[MessageContent]) -> list[ChatCompletionRequestMessage]:
-    """Convert MessageContent sequence to llama-cpp-python's expected format."""
-    return[
-        ChatCompletionRequestMessage(role=m["role"], content=m["content"]) for m in messages # type: ignore
-    ]
+    """Convert MessageContent sequence to llama-cpp-python's expected format.
+
+    MessageContent dicts already match ChatCompletionRequestMessage at runtime,
+    so they are passed through without copying; only non-list sequences are
+    turned into a list.
+    """
+    if not isinstance(messages, list):
+        messages = list(messages)
+    return cast(list[ChatCompletionRequestMessage], messages)
+
 
+def _yield_message(response) -> Generator[str, None, bool]:
+    """Yield the content or tool calls of a non-streaming completion.
 
-def stream_chat_completion(messages: Sequence[MessageContent], max_tokens=2048, temperature=0.3, top_p=0.9) -> Generator[str, None, None]:
+    Returns True if the model called tools.
     """
-    Get a chat completion response from the LLM.
+    # llama-cpp-python always returns plain dicts
+    try:
+        message = response["choices"][0]["message"]
+    except (KeyError, IndexError):
+        logger.warning("No message in response")
+        return False
+
+    tool_calls = message.get("tool_calls")
+    if tool_calls:
+        logger.debug("Tool calls detected: %s", tool_calls)
+        # Yield tool call information as a special format
+        yield orjson.dumps({"tool_calls": tool_calls}).decode()
+        return True
+
+    content = message.get("content")
+    if content:
+        yield content
+    else:
+        logger.warning("No content or tool calls in message")
+    return False
+
+
+def _yield_deltas(chunks) -> Generator[str, None, bool]:
+    """Yield content deltas as they arrive, and any streamed tool calls once complete.
+
+    Returns True if the model called tools.
+    """
+    tool_calls: dict[int, dict] = {}
+    for chunk in chunks:
+        try:
+            delta = chunk["choices"][0]["delta"]
+        except (KeyError, IndexError):
+            continue
+        content = delta.get("content")
+        if content:
+            yield content
+        for call in delta.get("tool_calls") or ():
+            entry = tool_calls.setdefault(
+                call["index"],
+                {"id": call.get("id"), "type": "function", "function": {"name": "", "arguments": ""}},
+            )
+            function = call.get("function") or {}
+            if function.get("name"):
+                entry["function"]["name"] = function["name"]
+            entry["function"]["arguments"] += function.get("arguments") or ""
+    if tool_calls:
+        logger.debug("Tool calls detected: %s", tool_calls)
+        yield orjson.dumps({"tool_calls": [tool_calls[i] for i in sorted(tool_calls)]}).decode()
+    return bool(tool_calls)
+
+
+def stream_chat_completion(messages: Sequence[MessageContent], max_tokens=2048, temperature=0.3, top_p=0.9, tools: list[ChatCompletionTool] | None = None, cancel: threading.Event | None = None) -> Generator[str, None, None]:
+    """
+    Stream a chat completion response from the LLM.
     
-    Note: When tools are enabled, returns non-streaming responses to properly handle tool calls.
+    Content is yielded token by token as it is decoded. The exception is when
+    the model decides to call a tool under chat formats that cannot stream an
+    automatic tool choice (e.g. chatml-function-calling); that turn is
+    completed without streaming and the tool calls are yielded at once.
     
     Args:
         messages: List of messages of type MessageContent with 'role' and 'content' keys:
@@ -58,78 +219,124 @@ def stream_chat_completion(messages: Sequence[MessageContent], max_tokens=2048,
         max_tokens: Maximum tokens to generate
         temperature: Sampling temperature (0.0 to 1.0)
         top_p: Nucleus sampling parameter
+        tools: OpenAI-style function specs; defaults to every tool in the registry
+        cancel: Event that ends generation early once set
         
     Yields:
         str: Content tokens or tool call information
 
     Raises:
-        ValueError: If messages are not properly formatted or temp/top_p are out of range
+        ValueError: If the prompt does not fit in the context window; other llama.cpp
+            errors propagate unchanged
     """
     logger.info("stream_chat_completion called")
-    logger.debug(f"Messages: {messages}")
-    logger.debug(f"max_tokens={max_tokens}, temp={temperature}, top_p={top_p}")
+    logger.debug("Messages: %s", messages)
+    logger.debug("max_tokens=%s, temp=%s, top_p=%s", max_tokens, temperature, top_p)
     
+    prompt_cache = _get_prompt_cache()
+    if prompt_cache is not None:
+        cached = prompt_cache.lookup(messages)
+        if cached is not None:
+            logger.info("Answered from the semantic prompt cache")
+            yield cached
+            return
+
     try:
+        llm = get_llm()
         logger.info("Creating chat completion...")
-        tools_dicts = tool_registry.get_tools()
-        tools: list[ChatCompletionTool] = [
-            ChatCompletionTool(
-                type=tool_dict["type"],
-                function=tool_dict["function"]
-            )
-            for tool_dict in tools_dicts
-        ]
-    
+        if tools is None:
+            tools = cast(list[ChatCompletionTool], tool_registry.get_tools())
 
-        response = llm.create_chat_completion(
+        request = dict(
             messages=_convert_messages(messages),
             max_tokens=max_tokens,
             temperature=temperature,
             top_p=top_p,
-            stream=False,
-            tools=tools,
-            tool_choice="auto"
+            logits_processor=_cancel_processor(llm, cancel) if cancel else None,
         )
-        logger.info("Chat completion received")
-        logger.debug(f"Full response: {response}")
-        
-        # Extract the message from the response
-        if isinstance(response, dict):
-            choices = response.get("choices", []) # type: ignore
-        else:
-            choices = getattr(response, "choices", [])
-        
-        if not choices:
-            logger.warning("No choices in response")
-            return
-        
-        choice = choices[0]
-        message = choice.get("message") if isinstance(choice, dict) else getattr(choice, "message", None)
-        
-        if not message:
-            logger.warning("No message in choice")
-            return
-        
-        # Check for tool calls
-        tool_calls = message.get("tool_calls") if isinstance(message, dict) else getattr(message, "tool_calls", None)
-        
-        if tool_calls:
-            logger.info(f"Tool calls detected: {tool_calls}")
-            # Yield tool call information as a special format
-            import json
-            yield json.dumps({"tool_calls": tool_calls})
+        if tools:
+            request.update(tools=tools, tool_choice="auto")
+
+        parts: list[str] = []
+        try:
+            chunks = llm.create_chat_completion(**request, stream=True)  # type: ignore[arg-type]
+        except ValueError as e:
+            if "streaming tool choice" not in str(e):
+                raise
+            # The model picked a tool; the handler can only return that non-streamed.
+            output = _yield_message(llm.create_chat_completion(**request, stream=False))  # type: ignore[arg-type]
         else:
-            # Regular text response
-            content = message.get("content") if isinstance(message, dict) else getattr(message, "content", None)
-            if content:
-                logger.info(f"Yielding content: {repr(content)}")
-                yield content
-            else:
-                logger.warning("No content or tool calls in message")
+            output = _yield_deltas(chunks)
+        while True:
+            try:
+                part = next(output)
+            except StopIteration as stop:
+                called_tools = stop.value
+                break
+            parts.append(part)
+            yield part
+        logger.info("Chat completion finished")
+
+        if prompt_cache is not None and not called_tools and not (cancel and cancel.is_set()):
+            prompt_cache.store(messages, "".join(parts))
                 
-    except Exception as e:
-        logger.error(f"Error during chat completion: {e}", exc_info=True)
-        raise ValueError(f"Error during chat completion: {e}")
+    except Exception:
+        logger.error("Error during chat completion", exc_info=True)
+        raise
+
+
+async def astream_chat_completion(messages: Sequence[MessageContent], max_tokens=2048, temperature=0.3, top_p=0.9, tools: list[ChatCompletionTool] | None = None) -> AsyncIterator[str]:
+    """
+    Async variant of `stream_chat_completion` for use inside an event loop.
+
+    The blocking llama.cpp generation runs in a worker thread and hands tokens
+    over through a bounded queue, so the event loop stays free between tokens.
+    Closing the iterator early cancels the generation in progress.
+
+    Args:
+        messages: List of messages of type MessageContent with 'role' and 'content' keys
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature (0.0 to 1.0)
+        top_p: Nucleus sampling parameter
+        tools: OpenAI-style function specs; defaults to every tool in the registry
+
+    Yields:
+        str: Content tokens or tool call information
+
+    Raises:
+        ValueError: If the prompt does not fit in the context window; other llama.cpp
+            errors propagate unchanged
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[str | Exception | None] = asyncio.Queue(maxsize=64)
+    stop = threading.Event()
+
+    def put(item: str | Exception | None) -> None:
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def produce() -> None:
+        try:
+            for token in stream_chat_completion(messages, max_tokens, temperature, top_p, tools, cancel=stop):
+                if stop.is_set():
+                    return
+                put(token)
+        except Exception as e:
+            put(e)
+        else:
+            put(None)
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        await producer
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue so it can see `stop`.
+        while not queue.empty():
+            queue.get_nowait()
 
 
 if __name__ == "__main__":
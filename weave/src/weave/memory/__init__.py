@@ -4,6 +4,6 @@ Persistence and retrieval system.
 Three-tier memory architecture:
 - Tier 1: Conversation history (JSON files)
 - Tier 2: Project context (SQLite)
-- Tier 3: Semantic search (ChromaDB)
+- Tier 3: Semantic search (FAISS)
 """
 
@@ -1,5 +1,5 @@
 """
-Tier 3: Semantic search via ChromaDB.
+Tier 3: Semantic search via FAISS.
 
 Vector-based similarity search:
 - Text embedding using sentence-transformers
@@ -8,3 +8,207 @@ Vector-based similarity search:
 - Persistent vector storage
 """
 
+import asyncio
+import functools
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from weave.core.config import DATA_DIR
+from weave.core.logging import logger
+
+# 384-dim embeddings, small enough to share the CPU with the LLM.
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _quantized_onnx_file() -> str:
+    """Pick the int8 ONNX export of the embedding model that suits this CPU."""
+    try:
+        cpu_flags = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        cpu_flags = ""
+    if "avx512_vnni" in cpu_flags:
+        return "onnx/model_qint8_avx512_vnni.onnx"
+    return "onnx/model_quint8_avx2.onnx"
+
+
+@functools.lru_cache(maxsize=None)
+def load_embedding_model(name: str = DEFAULT_EMBEDDING_MODEL):
+    """Load a sentence-transformers model once per process, shared by all users."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(
+        name,
+        device="cpu",
+        backend="onnx",
+        model_kwargs={"file_name": _quantized_onnx_file()},
+    )
+
+
+class SemanticMemory:
+    """
+    Persistent vector store for conversation and code snippets.
+
+    Vectors live in an exact FAISS inner-product index (cosine similarity on
+    normalized embeddings); document text and metadata live in a SQLite table
+    whose `pos` column is the vector's position in the index.
+
+    Writes are buffered and committed in batches, either when `max_batch`
+    documents are pending or every `flush_interval` seconds while the
+    background flusher started by `start()` is running. Embeddings are
+    computed per batch in one call, using the int8-quantized ONNX export
+    of the embedding model. The index file is written by `save()` and `close()`;
+    rows committed after the last save are re-embedded on the next load.
+
+    Requires the optional `memory` extra (faiss-cpu, sentence-transformers).
+    """
+
+    def __init__(
+        self,
+        path: Path = DATA_DIR / "vectors",
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        max_batch: int = 128,
+        flush_interval: float = 2.0,
+    ) -> None:
+        self.path = path
+        self.embedding_model = embedding_model
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: list[tuple[str, str, dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._index = None
+        self._encoder = None
+        self._flusher: asyncio.Task | None = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.path / "index.faiss"
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path / "documents.db", check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "pos INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, "
+                "text TEXT NOT NULL, metadata BLOB NOT NULL)"
+            )
+        return self._db
+
+    @property
+    def index(self):
+        if self._index is None:
+            import faiss
+
+            if self.index_path.exists():
+                index = faiss.read_index(str(self.index_path))
+            else:
+                index = faiss.IndexFlatIP(self.encoder.get_sentence_embedding_dimension())
+            # Catch up on rows committed after the index was last saved.
+            missing = self.db.execute(
+                "SELECT text FROM documents WHERE pos >= ? ORDER BY pos", (index.ntotal,)
+            ).fetchall()
+            if missing:
+                index.add(self.embed([text for (text,) in missing]))
+            self._index = index
+        return self._index
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            self._encoder = load_embedding_model(self.embedding_model)
+        return self._encoder
+
+    def embed(self, texts: list[str]):
+        """Embed a batch of texts in a single encoder call."""
+        return self.encoder.encode(
+            texts, batch_size=64, normalize_embeddings=True, convert_to_numpy=True
+        )
+
+    def add(self, doc_id: str, text: str, metadata: dict[str, Any]) -> None:
+        """Queue a document for indexing, flushing once a full batch is pending."""
+        with self._lock:
+            self._pending.append((doc_id, text, metadata))
+            batch_full = len(self._pending) >= self.max_batch
+        if batch_full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Embed and store all pending documents; ids already stored are skipped."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        with self._write_lock:
+            index, db = self.index, self.db
+            batch = {doc_id: (text, metadata) for doc_id, text, metadata in pending}
+            placeholders = ",".join("?" * len(batch))
+            for (doc_id,) in db.execute(
+                f"SELECT id FROM documents WHERE id IN ({placeholders})", list(batch)
+            ):
+                del batch[doc_id]
+            if not batch:
+                return
+            rows = [
+                (index.ntotal + offset, doc_id, text, orjson.dumps(metadata))
+                for offset, (doc_id, (text, metadata)) in enumerate(batch.items())
+            ]
+            with db:
+                db.executemany("INSERT INTO documents VALUES (?, ?, ?, ?)", rows)
+            index.add(self.embed([row[2] for row in rows]))
+        logger.debug("Flushed %d documents to semantic memory", len(rows))
+
+    def search(self, query: str, k: int = 5) -> list[dict[str, Any]]:
+        """Return up to `k` stored documents most similar to `query`."""
+        self.flush()
+        with self._write_lock:
+            scores, positions = self.index.search(self.embed([query]), k)
+            hits = [(int(pos), float(score)) for pos, score in zip(positions[0], scores[0]) if pos != -1]
+            if not hits:
+                return []
+            placeholders = ",".join("?" * len(hits))
+            rows = {
+                pos: (doc_id, text, metadata)
+                for pos, doc_id, text, metadata in self.db.execute(
+                    f"SELECT pos, id, text, metadata FROM documents WHERE pos IN ({placeholders})",
+                    [pos for pos, _ in hits],
+                )
+            }
+        return [
+            {"id": rows[pos][0], "text": rows[pos][1], "metadata": orjson.loads(rows[pos][2]), "score": score}
+            for pos, score in hits
+            if pos in rows
+        ]
+
+    def save(self) -> None:
+        """Write the vector index to disk."""
+        import faiss
+
+        with self._write_lock:
+            if self._index is not None:
+                faiss.write_index(self._index, str(self.index_path))
+
+    def start(self) -> None:
+        """Start flushing pending writes in the background every `flush_interval`."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """Stop the background flusher, write anything still pending and save the index."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await asyncio.to_thread(self.flush)
+        await asyncio.to_thread(self.save)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._pending:
+                await asyncio.to_thread(self.flush)
@@ -7,10 +7,18 @@ Defines the interface all tools must implement:
 - Input validation
 - Error handling conventions
 """
+import functools
 import os
 from weave.tools.schema import ToolSchema, ToolParameter
 from weave.tools.file_ops import read_file, validate_file_path, list_directory, edit_file, FileEdit
 
+
+@functools.lru_cache(maxsize=1)
+def working_dir() -> str:
+    """Directory the tools are sandboxed to, captured on first use."""
+    return os.getcwd()
+
+
 class Tool:
     """Base class for all tools."""
     schema: ToolSchema
@@ -42,7 +50,7 @@ class ReadFileTool(Tool):
     def execute(self, **kwargs) -> str:
         path = kwargs.get("path", "")
         max_chars = kwargs.get("max_chars")
-        is_valid, file_path, error = validate_file_path(os.getcwd(), path)
+        is_valid, file_path, error = validate_file_path(working_dir(), path)
         if not is_valid or file_path is None:
             return error or "Unknown error occurred"
         return read_file(file_path, max_chars)
@@ -59,7 +67,7 @@ class ListDirectoryTool(Tool):
     def execute(self, **kwargs) -> str:
         path: str = kwargs.get("path", "")
         max_depth = kwargs.get("max_depth", 2)
-        is_valid, dir_path, error = validate_file_path(os.getcwd(), path)
+        is_valid, dir_path, error = validate_file_path(working_dir(), path)
         if not is_valid or dir_path is None:
             return error or "Unknown error occurred"
         return list_directory(dir_path, max_depth)
@@ -70,7 +78,7 @@ class EditFileTool(Tool):
         description = "Performs targeted edits on a file without rewriting the entire content.",
         parameters = [
             ToolParameter(name="path", type="string", description="File path relative to working directory", required=True),
-            ToolParameter(name="edits", type="list", description="List of edits to perform", required=True),
+            ToolParameter(name="edits", type="array", description="List of edits to perform", required=True),
         ]
     )
 
@@ -81,11 +89,11 @@ class EditFileTool(Tool):
             FileEdit(
                 type=e.get("type", ""),
                 line_start=e.get("line_start", 0),
-                line_end=e.get("line_end", 0),
+                line_end=e.get("line_end"),
                 content=e.get("content", "")
             ) for e in edits_raw
         ]
-        is_valid, file_path, error = validate_file_path(os.getcwd(), path)
+        is_valid, file_path, error = validate_file_path(working_dir(), path)
         if not is_valid or file_path is None:
             return error or "Unknown error occurred"
         return edit_file(file_path, edits)
\ No newline at end of file
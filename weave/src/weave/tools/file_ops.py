@@ -12,12 +12,27 @@ All operations are sandboxed to prevent path traversal attacks.
 Paths are resolved relative to a configured working directory.
 """
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+import codecs
+import fnmatch
+import functools
+import os
 import re
 from dataclasses import dataclass
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-@dataclass
+# Directories search_files never descends into: VCS metadata, dependencies, build output.
+SKIPPED_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "dist", "build"})
+# Larger files are skipped by search_files; they are almost never hand-written source.
+MAX_SEARCH_FILE_BYTES = 2 * 1024 * 1024
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+@dataclass(slots=True)
 class FileEdit:
     """Represents a single file edit operation"""
     type: str  # 'insert', 'replace', 'delete', 'append'
@@ -26,21 +41,48 @@ class FileEdit:
     content: str = ""
 
 
+@functools.lru_cache(maxsize=32)
+def _resolved_root(working_dir: str) -> str:
+    """Resolve a working directory once; tools validate against the same few roots."""
+    return os.path.realpath(working_dir)
+
+
 def validate_file_path(working_dir: str, file_path: str) -> tuple[bool, Optional[Path], Optional[str]]:
     """
     Validates that a file path is within the safe working directory.
     Returns:
         Tuple of (is_valid, resolved_path, error_message)
     """
-    safe_zone: Path = Path(working_dir).resolve()
-    file: Path = (safe_zone / file_path).resolve()
-    if not file.is_relative_to(safe_zone):
+    safe_zone = _resolved_root(working_dir)
+    file = os.path.realpath(os.path.join(safe_zone, file_path))
+    if os.path.commonpath([safe_zone, file]) != safe_zone:
         return (
             False,
             None,
             f'Error: Cannot access "{file_path}" as it is outside the permitted working directory',
         )
-    return (True, file, None)
+    return (True, Path(file), None)
+
+
+def _write_atomic(file: Path, data: bytes) -> None:
+    """Replace `file` with `data` so readers see either the old or the new content.
+
+    Writes a sibling temp file in one call, syncs it, then renames it over the target.
+    """
+    tmp = file.with_name(file.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, file.stat().st_mode)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, file)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def read_file(file: Path, max_chars: Optional[int] = None) -> str:
@@ -51,8 +93,9 @@ def read_file(file: Path, max_chars: Optional[int] = None) -> str:
         max_chars: Optional character limit for truncation
     """
     try:
-        with file.open("r", encoding="utf-8") as f:
-            contents: str = f.read()
+        with file.open("r", encoding="utf-8", errors="replace") as f:
+            # Read one character past the limit, just enough to tell if it truncates.
+            contents: str = f.read(max_chars + 1) if max_chars else f.read()
             if max_chars and len(contents) > max_chars:
                 contents = contents[:max_chars]
                 contents += f"\n\n... File '{file}' truncated at {max_chars} characters"
@@ -70,17 +113,40 @@ def write_file(file: Path, contents: str) -> str:
     """
     try: 
         file.parent.mkdir(parents=True, exist_ok=True)  # create parent dirs if non-existent
-        with file.open("w", encoding="utf-8") as f:
-            f.write(contents)
+        _write_atomic(file, contents.encode("utf-8"))
         return f"Successfully wrote to '{file}'"
     except OSError as e:
         return f"Error writing to '{file}': {e}"
 
 
+def _edit_span(edit: FileEdit, line_count: int) -> Optional[tuple[int, int, bytes]]:
+    """Map an edit to (first line replaced, line after the last replaced, new content).
+
+    Line numbers are 0-based and clamped to the file; None for unknown edit types.
+    """
+    start = min(max(edit.line_start - 1, 0), line_count)
+    if edit.type == 'insert':
+        return start, start, (edit.content + '\n').encode()
+    if edit.type == 'append':
+        return line_count, line_count, (edit.content + '\n').encode()
+    if edit.type in ('replace', 'delete'):
+        line_end = edit.line_start if edit.line_end is None else edit.line_end
+        end = min(max(line_end, start), line_count)
+        if edit.type == 'delete':
+            return start, end, b''
+        new_lines = [line + '\n' for line in edit.content.split('\n') if line or edit.content == '']
+        return start, end, ''.join(new_lines).encode()
+    return None
+
+
 def edit_file(file: Path, edits: list[FileEdit]) -> str:
     """
     Performs targeted edits on a file without rewriting the entire content.
     
+    Line numbers in every edit refer to the file before any edit is applied.
+    The new content is built in one pass, copying the unchanged lines between
+    edits, so the cost is linear in the file size however many edits there are.
+    
     Args:
         file: Path object to edit
         edits: List of FileEdit operations to apply
@@ -89,38 +155,30 @@ def edit_file(file: Path, edits: list[FileEdit]) -> str:
         Success/error message
     """
     try:
-        with file.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        sorted_edits = sorted(edits, key=lambda e: e.line_start, reverse=True)
+        lines = file.read_bytes().splitlines(keepends=True)
+        spans = [span for edit in edits if (span := _edit_span(edit, len(lines))) is not None]
+        # Edits usually arrive in order (often just one); only sort when they don't.
+        if any(prev[0] > span[0] for prev, span in zip(spans, spans[1:])):
+            spans.sort(key=lambda span: span[0])
         
-        for edit in sorted_edits:
-            if edit.type == 'insert':
-                lines.insert(edit.line_start - 1, edit.content + '\n')
-                
-            elif edit.type == 'replace':
-                if edit.line_end is None:
-                    edit.line_end = edit.line_start
-                new_lines = [line + '\n' for line in edit.content.split('\n') if line or edit.content == '']
-                lines[edit.line_start - 1:edit.line_end] = new_lines
-                
-            elif edit.type == 'delete':
-                if edit.line_end is None:
-                    edit.line_end = edit.line_start
-                del lines[edit.line_start - 1:edit.line_end]
-                
-            elif edit.type == 'append':
-                lines.append(edit.content + '\n')
+        out: list[bytes] = []
+        cursor = 0
+        for start, end, content in spans:
+            start = max(start, cursor)  # overlapping edits start after the previous one
+            out.extend(lines[cursor:start])
+            if content:
+                if start == len(lines) and out and not out[-1].endswith((b'\n', b'\r')):
+                    out.append(b'\n')  # don't join added text onto an unterminated last line
+                out.append(content)
+            cursor = max(cursor, end)
+        out.extend(lines[cursor:])
         
-        with file.open("w", encoding="utf-8") as f:
-            f.writelines(lines)
+        _write_atomic(file, b''.join(out))
         
         return f"Successfully edited '{file}' with {len(edits)} operation(s)"
         
     except OSError as e:
         return f"Error editing '{file}': {e}"
-    except IndexError as e:
-        return f"Error: Invalid line number in edit operation for '{file}': {e}"
 
 
 def insert_at_line(file: Path, file_path: str, line_num: int, content: str) -> str:
@@ -168,31 +226,215 @@ def list_directory(directory: Path, max_depth: int = 2) -> str:
         
         result = [f"Contents of '{str(directory)}':"]
         
-        def list_recursive(path: Path, depth: int, prefix: str = ""):
-            if depth > max_depth:
-                return
-            
-            indent = "  " * depth
+        # Entries still to print, deepest-first; a directory's children are
+        # pushed when it is printed so they follow it in the output.
+        stack: list[tuple[os.DirEntry, int]] = []
+        
+        def push_children(path: str, depth: int):
             try:
-                items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-                for item in items:
-                    if item.is_dir():
-                        result.append(f"{indent}📁 {item.name}/")
-                        list_recursive(item, depth + 1, prefix + "  ")
-                    else:
-                        size = item.stat().st_size
-                        size_str = format_file_size(size)
-                        result.append(f"{indent}📄 {item.name} ({size_str})")
+                # DirEntry caches the file type from the directory read, so
+                # sorting and the is_dir checks below cost no extra syscalls.
+                with os.scandir(path) as it:
+                    items = sorted(it, key=lambda e: (not e.is_dir(), e.name))
             except PermissionError:
-                result.append(f"{indent}⚠️  [Permission Denied]")
+                result.append(f"{'  ' * depth}⚠️  [Permission Denied]")
+                return
+            stack.extend((item, depth) for item in reversed(items))
         
-        list_recursive(directory, 0)
+        push_children(str(directory), 0)
+        while stack:
+            item, depth = stack.pop()
+            indent = "  " * depth
+            if item.is_dir():
+                result.append(f"{indent}📁 {item.name}/")
+                # Vendored and VCS directories are shown but not expanded.
+                if depth < max_depth and item.name not in SKIPPED_DIRS:
+                    push_children(item.path, depth + 1)
+            else:
+                size = item.stat().st_size
+                size_str = format_file_size(size)
+                result.append(f"{indent}📄 {item.name} ({size_str})")
         return "\n".join(result)
         
     except OSError as e:
         return f"Error listing directory '{str(directory)}': {e}"
 
 
+def _compile_hyperscan(pattern: str, utf8: bool):
+    """Compile `pattern` into a Hyperscan database, or None to fall back to `re`.
+
+    With `utf8`, the database matches characters rather than bytes, using
+    Unicode classes and case folding like `re`; it is only valid for UTF-8
+    input. Hyperscan rejects some constructs (backreferences, lookarounds,
+    `\\b` in Unicode mode), in which case the pattern is searched with `re`.
+    """
+    if hyperscan is None:
+        return None
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+             | hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_SOM_LEFTMOST)
+    if utf8:
+        flags |= hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    db = hyperscan.Database()
+    try:
+        db.compile(expressions=[pattern.encode()], flags=[flags])
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _hyperscan_matching_lines(
+    data: bytes, db, regex: re.Pattern[str]
+) -> Iterator[tuple[int, str]]:
+    """Yield (line number, line) for each line of `data` with a Hyperscan match.
+
+    Matches spanning a newline are not hits by themselves; the line they end
+    on is checked on its own with `regex` instead.
+    """
+    starts: list[int] = []
+    crossing_ends: list[int] = []
+
+    def on_match(_id, start, end, _flags, _context):
+        if data.find(b"\n", start, end) == -1:
+            starts.append(start)
+        else:
+            crossing_ends.append(end - 1)
+
+    db.scan(data, match_event_handler=on_match)
+    for pos in set(crossing_ends):
+        line_start = data.rfind(b"\n", 0, pos) + 1
+        line_end = data.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(data)
+        if regex.search(data[line_start:line_end].decode("utf-8", errors="ignore")):
+            starts.append(line_start)
+    # Matches are reported by end offset, so their starts are not necessarily ordered.
+    counted = 0
+    line_num = 1
+    line_end = -1
+    for pos in sorted(set(starts)):
+        if pos <= line_end:
+            continue
+        if pos == len(data) and data.endswith(b"\n"):
+            break  # empty match after the final newline
+        line_num += data.count(b"\n", counted, pos)
+        counted = pos
+        line_start = data.rfind(b"\n", 0, pos) + 1
+        line_end = data.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(data)
+        yield line_num, data[line_start:line_end].decode("utf-8", errors="ignore")
+
+
+def _matching_lines(text: str, regex: re.Pattern[str]) -> Iterator[tuple[int, str]]:
+    """Yield (line number, line) for each line of `text` containing a match.
+
+    Searches the whole text at once and skips to the next line after a hit,
+    rather than running the regex on every line separately. A match that runs
+    past the end of its line (e.g. `\\s+` taking the newline) only counts if
+    the line matches on its own.
+    """
+    pos = counted = 0
+    line_num = 1
+    while pos < len(text) and (match := regex.search(text, pos)):
+        start = match.start()
+        if start == len(text) and text.endswith("\n"):
+            break  # empty match after the final newline
+        line_num += text.count("\n", counted, start)
+        counted = start
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = len(text)
+        if match.end() <= line_end or regex.search(text[line_start:line_end]):
+            yield line_num, text[line_start:line_end]
+        pos = line_end + 1
+
+
+def _match_parts(parts: tuple[str, ...], pattern: tuple[str, ...]) -> bool:
+    """Match path components against glob components; "**" spans any number of directories."""
+    if not pattern:
+        return not parts
+    head, rest = pattern[0], pattern[1:]
+    if head == "**":
+        return any(_match_parts(parts[i:], rest) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatch.fnmatchcase(parts[0], head) and _match_parts(parts[1:], rest)
+
+
+def _file_matching_lines(
+    data: bytes, regex: re.Pattern[str], ascii_db, utf8_db
+) -> Iterator[tuple[int, str]]:
+    """Yield (line number, line) for each matching line of a file's raw contents.
+
+    Uses Hyperscan where it gives the same answer as `re`: the byte-mode
+    database for ASCII files (and ASCII patterns), the UTF-8 one for other
+    valid UTF-8 files. Everything else is searched with `regex`.
+    """
+    if b"\r" in data:
+        # Universal newlines, as text mode gives the `re` path.
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if data.isascii():
+        db = ascii_db or utf8_db
+    else:
+        try:
+            data.decode("utf-8")
+        except UnicodeDecodeError:
+            db = None  # Hyperscan's UTF-8 mode is undefined on invalid input
+        else:
+            db = utf8_db
+    if db is not None:
+        return _hyperscan_matching_lines(data, db, regex)
+    return _matching_lines(data.decode("utf-8", errors="ignore"), regex)
+
+
+def _iter_search_files(directory: Path, file_pattern: str, max_bytes: int) -> Iterator[os.DirEntry]:
+    """Yield files under `directory` matching `file_pattern`, as Path.rglob would.
+
+    Skips SKIPPED_DIRS and files over `max_bytes` without opening them.
+    Symlinked directories are not followed, as with Path.rglob.
+    """
+    # rglob already searches every depth, so a leading "**/" adds nothing.
+    while file_pattern.startswith("**/"):
+        file_pattern = file_pattern[3:]
+    matches_name = re.compile(fnmatch.translate(file_pattern.rsplit("/", 1)[-1])).match
+    # Patterns with a directory part ("tests/*.py", "src/**/*.py") are matched
+    # against the path relative to `directory`, at any depth like rglob; the
+    # name is checked first as it is cheaper.
+    path_pattern = ("**", *file_pattern.split("/")) if "/" in file_pattern else None
+    stack = [str(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRS:
+                        stack.append(entry.path)
+                elif (
+                    matches_name(entry.name)
+                    and (path_pattern is None
+                         or _match_parts(tuple(os.path.relpath(entry.path, directory).split(os.sep)),
+                                         path_pattern))
+                    and entry.is_file()
+                    and entry.stat().st_size <= max_bytes
+                ):
+                    yield entry
+            except OSError:
+                continue
+
+
+def _open_for_search(path: str) -> int:
+    """Open a file read-only without updating its access time where the OS allows it."""
+    if _O_NOATIME:
+        try:
+            return os.open(path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:
+            pass  # O_NOATIME is only allowed on files we own
+    return os.open(path, os.O_RDONLY)
+
+
 def search_files(directory: Path, pattern: str, 
                 file_pattern: str = "*", max_results: int = 50) -> str:
     """
@@ -210,22 +452,27 @@ def search_files(directory: Path, pattern: str,
             return f"Error: '{str(directory)}' is not a valid directory"
         
         results = []
-        regex = re.compile(pattern, re.IGNORECASE)
+        regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        # A byte-mode database only agrees with `re` when the pattern is ASCII.
+        hs_ascii_db = _compile_hyperscan(pattern, utf8=False) if pattern.isascii() else None
+        hs_utf8_db = _compile_hyperscan(pattern, utf8=True)
         
-        for file_path in directory.rglob(file_pattern):
-            if not file_path.is_file():
-                continue
-            
+        for entry in _iter_search_files(directory, file_pattern, MAX_SEARCH_FILE_BYTES):
             try:
-                with file_path.open("r", encoding="utf-8", errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        if regex.search(line):
-                            relative_path = file_path.relative_to(directory)
-                            results.append(f"{relative_path}:{line_num}: {line.strip()}")
-                            
-                            if len(results) >= max_results:
-                                results.append(f"\n... Showing first {max_results} results")
-                                return "\n".join(results)
+                fd = _open_for_search(entry.path)
+                if hs_ascii_db is not None or hs_utf8_db is not None:
+                    with os.fdopen(fd, "rb") as f:
+                        matches = _file_matching_lines(f.read(), regex, hs_ascii_db, hs_utf8_db)
+                else:
+                    with os.fdopen(fd, "r", encoding="utf-8", errors="ignore") as f:
+                        matches = _matching_lines(f.read(), regex)
+                for line_num, line in matches:
+                    relative_path = os.path.relpath(entry.path, directory)
+                    results.append(f"{relative_path}:{line_num}: {line.strip()}")
+                    
+                    if len(results) >= max_results:
+                        results.append(f"\n... Showing first {max_results} results")
+                        return "\n".join(results)
             except Exception:
                 # Skip files that can't be read
                 continue
@@ -239,6 +486,35 @@ def search_files(directory: Path, pattern: str,
         return f"Error searching in '{str(directory)}': {e}"
 
 
+def _count_lines(file: Path, chunk_size: int = 1 << 20) -> Optional[int]:
+    """Count the lines of a text file as universal-newline text mode would.
+
+    Works on raw chunks instead of iterating decoded lines; returns None if
+    the file is not valid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    terminators = 0
+    last = b""
+    with file.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            if not chunk.isascii():
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    return None
+            # "\r\n" is one line ending, including when split across chunks.
+            terminators += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            if last == b"\r" and chunk.startswith(b"\n"):
+                terminators -= 1
+            last = chunk[-1:]
+    try:
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return None
+    # A last line without a line ending still counts.
+    return terminators + (last not in (b"", b"\n", b"\r"))
+
+
 def get_file_info(file: Path, file_path: str) -> str:
     """
     Gets information about a file (size, type, line count).
@@ -258,13 +534,15 @@ def get_file_info(file: Path, file_path: str) -> str:
         info.append(f"Size: {size}")
         info.append(f"Type: {file.suffix or 'no extension'}")
         
-        # Try to count lines if it's a text file
+        # Count lines on the raw bytes; invalid UTF-8 marks a binary file
         try:
-            with file.open("r", encoding="utf-8") as f:
-                line_count = sum(1 for _ in f)
-            info.append(f"Lines: {line_count}")
-        except Exception:
+            line_count = _count_lines(file)
+        except OSError:
+            line_count = None
+        if line_count is None:
             info.append("Lines: [binary file]")
+        else:
+            info.append(f"Lines: {line_count}")
         
         return "\n".join(info)
         
@@ -10,10 +10,13 @@ Implements JSON Schema-compatible tool definitions:
 Schemas are used both for LLM context and argument validation.
 """
 from __future__ import annotations
-from pydantic import BaseModel, field_validator
+import functools
+from pydantic import BaseModel, ConfigDict, field_validator
 
 class ToolParameter(BaseModel):
     """Base class for tool parameters."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str
     description: str
@@ -34,12 +37,22 @@ class ToolParameter(BaseModel):
 
 class ToolSchema(BaseModel):
     """Schema definition for a tool."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
-    parameters: list[ToolParameter]
+    parameters: tuple[ToolParameter, ...]
 
     def to_json_schema(self) -> dict:
-        """Convert ToolSchema to OpenAI/llama.cpp function format."""
+        """Convert ToolSchema to OpenAI/llama.cpp function format.
+
+        Returns the dict cached in `json_schema`; don't mutate it.
+        """
+        return self.json_schema
+
+    @functools.cached_property
+    def json_schema(self) -> dict:
+        """The OpenAI/llama.cpp function spec, built on first access."""
         properties = {}
         required = []
 
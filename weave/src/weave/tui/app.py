@@ -7,14 +7,16 @@ An on-device coding agent with local LLM inference.
 from __future__ import annotations
 
 import datetime
+import gc
 from pathlib import Path
 
+from textual import work
 from textual.app import App
 from textual.binding import Binding
 from textual.reactive import Reactive, reactive
 
 from weave.tui.chats_manager import ChatsManager
-from weave.tui.models import ChatData, ChatMessage, MessageContent, WeaveModel, DEFAULT_MODEL
+from weave.tui.models import ChatData, ChatMessage, MessageContent, WeaveModel, DEFAULT_MODEL, make_preview
 from weave.tui.screens.chat_screen import ChatScreen
 from weave.tui.screens.help_screen import HelpScreen
 from weave.tui.screens.home_screen import HomeScreen
@@ -65,32 +67,58 @@ Be casual, friendly, yet professional. Communicate clearly and concisely."""
     ):
         if system_prompt is None:
             system_prompt = self.DEFAULT_SYSTEM_PROMPT
-        # Load themes
-        available_themes: dict[str, Theme] = BUILTIN_THEMES.copy()
-        try:
-            available_themes |= load_user_themes()
-        except Exception:
-            pass  # Ignore user theme loading errors
-
-        self.themes: dict[str, Theme] = available_themes
+        # User themes are loaded in the background once the app is mounted.
+        self.themes: dict[str, Theme] = BUILTIN_THEMES.copy()
+        self._css_var_cache: dict[str, dict[str, str]] = {}
+        """Generated color system for each theme name."""
         self._theme_name = theme_name
         self.system_prompt = system_prompt
+        # Never mutated, so every new chat shares this one dict.
+        self._system_message: MessageContent = {
+            "content": system_prompt,
+            "role": "system",
+        }
         self.current_model = DEFAULT_MODEL
 
         super().__init__()
 
     async def on_mount(self) -> None:
         await self.push_screen(HomeScreen())
-        self.weave_theme = self._theme_name
+        # A user theme isn't available yet; it's swapped in once loaded.
+        self.weave_theme = self._theme_name if self._theme_name in self.themes else "cursor"
+        self.load_themes()
+
+    def on_ready(self) -> None:
+        # Modules, styles and the home screen live as long as the app; moving
+        # them to the permanent generation keeps collections during streaming
+        # from traversing them.
+        gc.freeze()
+
+    @work(thread=True, exclusive=True, group="user_themes")
+    def load_themes(self) -> None:
+        """Read the user's theme files off the event loop and merge them in."""
+        try:
+            user_themes = load_user_themes()
+        except Exception:
+            return  # Ignore user theme loading errors
+        if user_themes:
+            self.call_from_thread(self.add_user_themes, user_themes)
+
+    def add_user_themes(self, user_themes: dict[str, Theme]) -> None:
+        self.themes |= user_themes
+        # Only palettes for redefined theme names are stale.
+        for name in user_themes:
+            self._css_var_cache.pop(name, None)
+        if self._theme_name in user_themes and self.weave_theme != self._theme_name:
+            self.weave_theme = self._theme_name
+        elif self.weave_theme in user_themes:
+            # A user theme redefined the active one.
+            self.refresh_css(animate=False)
 
     async def launch_chat(self, prompt: str) -> None:
         """Launch a new chat with the given prompt."""
         current_time = datetime.datetime.now(datetime.timezone.utc)
         
-        system_message: MessageContent = {
-            "content": self.system_prompt,
-            "role": "system",
-        }
         user_message: MessageContent = {
             "content": prompt,
             "role": "user",
@@ -101,9 +129,11 @@ Be casual, friendly, yet professional. Communicate clearly and concisely."""
             title=None,
             create_timestamp=None,
             model=self.current_model,
+            update_ts=current_time,
+            preview=make_preview(prompt),
             messages=[
                 ChatMessage(
-                    message=system_message,
+                    message=self._system_message,
                     timestamp=current_time,
                     model=self.current_model,
                 ),
@@ -124,20 +154,19 @@ Be casual, friendly, yet professional. Communicate clearly and concisely."""
             await self.push_screen(HelpScreen())
 
     def get_css_variables(self) -> dict[str, str]:
+        color_system: dict[str, str] = {}
         if self.weave_theme:
-            theme = self.themes.get(self.weave_theme)
-            if theme:
+            cached = self._css_var_cache.get(self.weave_theme)
+            if cached is not None:
+                color_system = cached
+            elif theme := self.themes.get(self.weave_theme):
                 color_system = theme.to_color_system().generate()
-            else:
-                color_system = {}
-        else:
-            color_system = {}
+                self._css_var_cache[self.weave_theme] = color_system
 
         return {**super().get_css_variables(), **color_system}
 
     def watch_weave_theme(self, theme: str | None) -> None:
         self.refresh_css(animate=False)
-        self.screen._update_styles()
 
     @property
     def theme_object(self) -> Theme | None:
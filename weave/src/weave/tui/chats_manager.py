@@ -1,53 +1,142 @@
 """
-Weave chats manager - in-memory storage stub.
+Weave chats manager - SQLite-backed chat storage.
 
-TODO: Replace with SQLite persistence in Phase 4.
+Chats persist across sessions in the database opened by `weave.tui.db`.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import sqlite3
+import sys
 from datetime import datetime, timezone
 
-from weave.tui.models import ChatData, ChatMessage
+from weave.tui import db
+from weave.tui.models import DEFAULT_MODEL, ChatData, ChatMessage, ChatSummary, WeaveModel
+
+_CHAT_COLUMNS = "id, title, model_id, create_ts, update_ts, preview"
+_MESSAGE_COLUMNS = "role, content, ts, model_id"
+
+
+def _iso(value: datetime) -> str:
+    # Stored in UTC so that timestamps sort correctly as text.
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+@functools.lru_cache(maxsize=None)
+def _model(model_id: str) -> WeaveModel:
+    # Models are immutable, so rows with the same model share one instance.
+    if model_id == DEFAULT_MODEL.id:
+        return DEFAULT_MODEL
+    return WeaveModel(id=model_id, name=model_id)
+
+
+def _chat_message(row: tuple) -> ChatMessage:
+    role, content, ts, model_id = row
+    # sqlite3 returns a new string per row; interning shares one per role.
+    role = sys.intern(role)
+    if role == "system":
+        # Chats share a handful of system prompts; keep one copy of each.
+        content = sys.intern(content)
+    return ChatMessage(
+        message={"role": role, "content": content},
+        timestamp=_timestamp(ts),
+        model=_model(model_id),
+    )
+
+
+def _chat(row: tuple, messages: list[ChatMessage]) -> ChatData:
+    chat_id, title, model_id, create_ts, update_ts, preview = row
+    return ChatData(
+        id=chat_id,
+        model=_model(model_id),
+        title=title,
+        create_timestamp=_timestamp(create_ts),
+        messages=messages,
+        update_ts=datetime.fromisoformat(update_ts),
+        preview=preview,
+    )
+
+
+def _summary(row: tuple) -> ChatSummary:
+    chat_id, title, model_id, update_ts, preview = row
+    return ChatSummary(
+        id=chat_id,
+        model=_model(model_id),
+        title=title,
+        update_ts=datetime.fromisoformat(update_ts),
+        preview=preview,
+    )
+
+
+def _select_messages(conn: sqlite3.Connection, chat_id: int) -> list[ChatMessage]:
+    rows = conn.execute(
+        f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE chat_id = ? ORDER BY idx", (chat_id,)
+    )
+    return [_chat_message(row) for row in rows]
+
+
+def _message_values(chat_id: int, idx: int, message: ChatMessage) -> tuple:
+    return (
+        chat_id,
+        idx,
+        message.role,
+        message.content,
+        _iso(message.timestamp) if message.timestamp else None,
+        message.model.id,
+    )
 
 
-@dataclass
 class ChatsManager:
-    """In-memory chat storage manager.
-    
-    This is a stub implementation that stores chats in memory.
-    Replace with SQLite persistence when implementing Phase 4.
-    """
-    
-    # Class-level storage for chats (in-memory)
-    _chats: dict[int, ChatData] = None  # type: ignore
-    _next_id: int = 1
+    """Chat storage manager.
 
-    def __post_init__(self) -> None:
-        if ChatsManager._chats is None:
-            ChatsManager._chats = {}
+    Chats and messages are stored in SQLite; each method is a single indexed
+    query or transaction run off the event loop. All methods are static, so
+    the class is used directly rather than instantiated.
+    """
 
     @staticmethod
-    def _ensure_storage() -> None:
-        """Ensure the storage dict exists."""
-        if ChatsManager._chats is None:
-            ChatsManager._chats = {}
+    async def page_chats(offset: int, limit: int) -> list[ChatSummary]:
+        """Get one page of non-archived chats, most recently updated first.
+
+        Messages are not read; `get_chat` loads them when a chat is opened.
+        """
+
+        def query(conn: sqlite3.Connection) -> list[ChatSummary]:
+            rows = conn.execute(
+                "SELECT id, title, model_id, update_ts, preview FROM chats "
+                "WHERE archived = 0 ORDER BY update_ts DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
+            return [_summary(row) for row in rows]
+
+        return await db.run(query)
 
     @staticmethod
-    async def all_chats() -> list[ChatData]:
-        """Get all non-archived chats."""
-        ChatsManager._ensure_storage()
-        # Return chats sorted by most recent first
-        chats = list(ChatsManager._chats.values())
-        chats.sort(key=lambda c: c.update_time, reverse=True)
-        return chats
+    async def count_chats() -> int:
+        """Count the non-archived chats."""
+
+        def query(conn: sqlite3.Connection) -> int:
+            (count,) = conn.execute("SELECT COUNT(*) FROM chats WHERE archived = 0").fetchone()
+            return count
+
+        return await db.run(query)
 
     @staticmethod
     async def get_chat(chat_id: int) -> ChatData:
         """Get a specific chat by ID."""
-        ChatsManager._ensure_storage()
-        chat = ChatsManager._chats.get(chat_id)
+
+        def query(conn: sqlite3.Connection) -> ChatData | None:
+            row = conn.execute(
+                f"SELECT {_CHAT_COLUMNS} FROM chats WHERE id = ?", (chat_id,)
+            ).fetchone()
+            return _chat(row, _select_messages(conn, chat_id)) if row else None
+
+        chat = await db.run(query)
         if not chat:
             raise RuntimeError(f"Chat with ID {chat_id} not found.")
         return chat
@@ -55,46 +144,76 @@ class ChatsManager:
     @staticmethod
     async def rename_chat(chat_id: int, new_title: str) -> None:
         """Rename a chat."""
-        ChatsManager._ensure_storage()
-        chat = ChatsManager._chats.get(chat_id)
-        if chat:
-            chat.title = new_title
+        await db.run(
+            lambda conn: conn.execute("UPDATE chats SET title = ? WHERE id = ?", (new_title, chat_id))
+        )
 
     @staticmethod
     async def get_messages(chat_id: int) -> list[ChatMessage]:
         """Get all messages for a chat."""
-        ChatsManager._ensure_storage()
-        chat = ChatsManager._chats.get(chat_id)
-        if not chat:
+
+        def query(conn: sqlite3.Connection) -> list[ChatMessage] | None:
+            if conn.execute("SELECT 1 FROM chats WHERE id = ?", (chat_id,)).fetchone() is None:
+                return None
+            return _select_messages(conn, chat_id)
+
+        messages = await db.run(query)
+        if messages is None:
             raise RuntimeError(f"Chat with ID {chat_id} not found.")
-        return chat.messages
+        return messages
 
     @staticmethod
     async def create_chat(chat_data: ChatData) -> int:
         """Create a new chat and return its ID."""
-        ChatsManager._ensure_storage()
-        chat_id = ChatsManager._next_id
-        ChatsManager._next_id += 1
-        
-        chat_data.id = chat_id
-        chat_data.create_timestamp = datetime.now(timezone.utc)
-        ChatsManager._chats[chat_id] = chat_data
-        
-        return chat_id
+        now = datetime.now(timezone.utc)
+        update_ts = _iso(chat_data.update_ts)
+
+        def query(conn: sqlite3.Connection) -> int:
+            with db.transaction(conn):
+                cursor = conn.execute(
+                    "INSERT INTO chats (title, model_id, create_ts, update_ts, preview) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (chat_data.title, chat_data.model.id, _iso(now), update_ts, chat_data.preview),
+                )
+                chat_id = cursor.lastrowid
+                assert chat_id is not None
+                conn.executemany(
+                    "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)",
+                    [_message_values(chat_id, idx, m) for idx, m in enumerate(chat_data.messages)],
+                )
+            return chat_id
+
+        chat_data.id = await db.run(query)
+        chat_data.create_timestamp = now
+        return chat_data.id
 
     @staticmethod
     async def archive_chat(chat_id: int) -> None:
-        """Archive (delete from memory) a chat."""
-        ChatsManager._ensure_storage()
-        if chat_id in ChatsManager._chats:
-            del ChatsManager._chats[chat_id]
+        """Archive a chat, hiding it from the chat list."""
+        await db.run(
+            lambda conn: conn.execute("UPDATE chats SET archived = 1 WHERE id = ?", (chat_id,))
+        )
 
     @staticmethod
     async def add_message_to_chat(chat_id: int, message: ChatMessage) -> None:
         """Add a message to an existing chat."""
-        ChatsManager._ensure_storage()
-        chat = ChatsManager._chats.get(chat_id)
-        if not chat:
+        update_ts = _iso(message.timestamp or datetime.now(timezone.utc))
+
+        def query(conn: sqlite3.Connection) -> bool:
+            with db.transaction(conn):
+                updated = conn.execute(
+                    "UPDATE chats SET update_ts = ? WHERE id = ?", (update_ts, chat_id)
+                ).rowcount
+                if not updated:
+                    return False
+                (idx,) = conn.execute(
+                    "SELECT COALESCE(MAX(idx) + 1, 0) FROM messages WHERE chat_id = ?", (chat_id,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)",
+                    _message_values(chat_id, idx, message),
+                )
+            return True
+
+        if not await db.run(query):
             raise RuntimeError(f"Chat with ID {chat_id} not found.")
-        chat.messages.append(message)
-
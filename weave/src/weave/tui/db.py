@@ -0,0 +1,77 @@
+"""
+SQLite storage for chats.
+
+Chats and their messages live in one database file in the data directory,
+opened once in WAL mode. Every query runs on a single dedicated thread, so
+the event loop never waits on disk and transactions never interleave.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+from weave.core.config import DATA_DIR
+
+T = TypeVar("T")
+
+DB_PATH = DATA_DIR / "chats.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    model_id TEXT NOT NULL,
+    create_ts TEXT NOT NULL,
+    update_ts TEXT NOT NULL,
+    archived INTEGER NOT NULL DEFAULT 0,
+    preview TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_chats_update_ts ON chats(update_ts DESC) WHERE archived = 0;
+CREATE TABLE IF NOT EXISTS messages (
+    chat_id INTEGER NOT NULL REFERENCES chats(id),
+    idx INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    ts TEXT,
+    model_id TEXT NOT NULL,
+    PRIMARY KEY (chat_id, idx)
+) WITHOUT ROWID;
+"""
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weave-db")
+
+
+@functools.lru_cache(maxsize=1)
+def connect(path: Path = DB_PATH) -> sqlite3.Connection:
+    """Open the chat database, creating the schema on first use."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit; multi-statement writes use `transaction`.
+    db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(_SCHEMA)
+    return db
+
+
+@contextlib.contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements atomically."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+async def run(query: Callable[[sqlite3.Connection], T]) -> T:
+    """Run `query` against the chat database on the database thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, lambda: query(connect()))
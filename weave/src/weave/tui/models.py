@@ -17,7 +17,7 @@ class MessageContent(TypedDict, total=False):
     role: Literal["system", "user", "assistant", "tool", "function"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeaveModel:
     """Represents a local LLM model configuration."""
     id: str
@@ -30,6 +30,17 @@ class WeaveModel:
         return self.id
 
 
+PREVIEW_CHARS = 77
+
+
+def make_preview(content: str) -> str:
+    """Single-line preview of a message for the chat list and header."""
+    content = content.replace("\n", " ")
+    if len(content) > PREVIEW_CHARS:
+        return content[:PREVIEW_CHARS] + "..."
+    return content
+
+
 # Default model placeholder - will be replaced when llama.cpp integration is added
 DEFAULT_MODEL = WeaveModel(
     id="local",
@@ -39,7 +50,7 @@ DEFAULT_MODEL = WeaveModel(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """A single message in a chat conversation."""
     message: MessageContent
@@ -55,26 +66,36 @@ class ChatMessage:
         return self.message.get("content", "")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ChatSummary:
+    """A chat as shown in the chat list, without its messages."""
+    id: int
+    model: WeaveModel
+    title: str | None
+    update_ts: datetime
+    preview: str
+
+
+@dataclass(slots=True)
 class ChatData:
     """Represents a chat conversation."""
     id: int | None  # Can be None before the chat gets assigned ID
     model: WeaveModel
     title: str | None
     create_timestamp: datetime | None
-    messages: list[ChatMessage] = field(default_factory=list)
-
-    @property
-    def short_preview(self) -> str:
-        """Get a short preview of the first user message."""
-        first_message = self.first_user_message
-        if first_message:
-            content = first_message.message.get("content", "")
-            if content and isinstance(content, str):
-                if len(content) > 77:
-                    return content[:77] + "..."
-                return content
-        return ""
+    messages: list[ChatMessage] = field(default_factory=list, repr=False, compare=False)
+    update_ts: datetime = field(default_factory=lambda: datetime.now(UTC))
+    """When the last message was added, in UTC."""
+    preview: str = ""
+    """Preview of the first user message, see `make_preview`."""
+
+    def add_message(self, message: ChatMessage) -> None:
+        """Append a message and record it as the latest update."""
+        self.messages.append(message)
+        if message.timestamp:
+            self.update_ts = message.timestamp.astimezone(UTC)
+        else:
+            self.update_ts = datetime.now(UTC)
 
     @property
     def system_prompt(self) -> ChatMessage | None:
@@ -97,10 +118,6 @@ class ChatData:
 
     @property
     def update_time(self) -> datetime:
-        """Get the timestamp of the last message."""
-        if self.messages:
-            message_timestamp = self.messages[-1].timestamp
-            if message_timestamp:
-                return message_timestamp.astimezone().replace(tzinfo=UTC)
-        return datetime.now(UTC)
+        """Alias of `update_ts`."""
+        return self.update_ts
 
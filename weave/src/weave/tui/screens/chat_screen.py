@@ -6,13 +6,18 @@ from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer
 
 from weave.tui.chats_manager import ChatsManager
 from weave.tui.widgets.response_status import ResponseStatus
-from weave.tui.widgets.chat import Chat
+from weave.tui.widgets.chat import Chat, TokenBuffer
+from weave.tui.widgets.chatbox import Chatbox
 from weave.tui.models import ChatData
 
+TOKEN_FLUSH_INTERVAL = 0.016
+"""Seconds streamed tokens are buffered before being rendered (one 60 fps frame)."""
+
 
 class ChatScreen(Screen[None]):
     AUTO_FOCUS = "ChatPromptInput"
@@ -29,37 +34,65 @@ class ChatScreen(Screen[None]):
     def __init__(self, chat_data: ChatData):
         super().__init__()
         self.chat_data = chat_data
-        self.chats_manager = ChatsManager()
+        self._pending: tuple[Chatbox, TokenBuffer] | None = None
+        self._flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Chat(self.chat_data)
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Looked up once; the handlers below run for every response.
+        self._response_status = self.query_one(ResponseStatus)
+
     @on(Chat.NewUserMessage)
     def new_user_message(self, event: Chat.NewUserMessage) -> None:
         """Handle a new user message."""
-        self.query_one(Chat).allow_input_submit = False
-        response_status = self.query_one(ResponseStatus)
+        response_status = self._response_status
         response_status.set_awaiting_response()
         response_status.display = True
 
     @on(Chat.AgentResponseStarted)
     def start_awaiting_response(self) -> None:
-        """Prevent sending messages because the agent is typing."""
-        response_status = self.query_one(ResponseStatus)
+        """Show that the agent is typing."""
+        response_status = self._response_status
         response_status.set_agent_responding()
         response_status.display = True
 
+    @on(Chat.TokensReceived)
+    def schedule_flush(self, event: Chat.TokensReceived) -> None:
+        """Render the streamed tokens on the next flush."""
+        self._pending = (event.chatbox, event.tokens)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(TOKEN_FLUSH_INTERVAL, self.flush_tokens)
+
+    def flush_tokens(self) -> None:
+        """Append all queued tokens to the response in one update."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if self._pending is None:
+            return
+        chatbox, tokens = self._pending
+        if text := tokens.drain():
+            chatbox.append_chunk(text)
+
+    @on(Chat.AgentResponseFailed)
+    def agent_response_failed(self) -> None:
+        """Show whatever was streamed before the failure."""
+        self.flush_tokens()
+
     @on(Chat.AgentResponseComplete)
     async def agent_response_complete(self, event: Chat.AgentResponseComplete) -> None:
-        """Allow the user to send messages again."""
-        self.query_one(ResponseStatus).display = False
-        self.query_one(Chat).allow_input_submit = True
+        """Persist the agent's response."""
+        # Tokens are handled before this event, but may still be buffered.
+        self.flush_tokens()
+        self._response_status.display = False
         
         if self.chat_data.id is None:
             raise RuntimeError("Chat has no ID. This is likely a bug in Weave.")
 
-        await self.chats_manager.add_message_to_chat(
+        await ChatsManager.add_message_to_chat(
             chat_id=self.chat_data.id, message=event.message
         )
 
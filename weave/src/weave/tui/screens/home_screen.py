@@ -56,10 +56,12 @@ ChatList {
     ) -> None:
         super().__init__(name, id, classes)
         self.weave = cast("Weave", self.app)
-        self.chats_manager = ChatsManager()
 
     def on_mount(self) -> None:
         """Handle screen mount event."""
+        self._chat_list = self.query_one(ChatList)
+        self._prompt_input = self.query_one(HomePromptInput)
+        self._welcome = self.query_one(Welcome)
 
     def compose(self) -> ComposeResult:
         """Compose the home screen layout."""
@@ -72,8 +74,7 @@ ChatList {
     @on(ScreenResume)
     async def reload_screen(self) -> None:
         """Reload chat list when screen resumes."""
-        chat_list = self.query_one(ChatList)
-        await chat_list.reload_and_refresh()
+        await self._chat_list.reload_and_refresh()
         self.show_welcome_if_required()
 
     @on(ChatList.ChatOpened)
@@ -81,13 +82,13 @@ ChatList {
         """Open the selected chat in a new screen."""
         chat_id = event.chat.id
         assert chat_id is not None
-        chat = await self.chats_manager.get_chat(chat_id)
+        chat = await ChatsManager.get_chat(chat_id)
         await self.app.push_screen(ChatScreen(chat))
 
     @on(ChatList.CursorEscapingTop)
     def cursor_escaping_top(self) -> None:
         """Move focus to prompt when cursor escapes chat list."""
-        self.query_one(HomePromptInput).focus()
+        self._prompt_input.focus()
 
     @on(PromptInput.PromptSubmitted)
     async def create_new_chat(self, event: PromptInput.PromptSubmitted) -> None:
@@ -102,15 +103,11 @@ ChatList {
 
     def action_send_message(self) -> None:
         """Trigger prompt submission."""
-        prompt_input = self.query_one(PromptInput)
-        prompt_input.action_submit_prompt()
+        self._prompt_input.action_submit_prompt()
 
     def show_welcome_if_required(self) -> None:
         """Show or hide welcome message based on chat list state."""
-        chat_list = self.query_one(ChatList)
-        if chat_list.option_count == 0:
-            welcome = self.query_one(Welcome)
-            welcome.display = "block"
+        if self._chat_list.option_count == 0:
+            self._welcome.display = "block"
         else:
-            welcome = self.query_one(Welcome)
-            welcome.display = "none"
\ No newline at end of file
+            self._welcome.display = "none"
\ No newline at end of file
@@ -28,6 +28,7 @@ class AppHeader(Widget):
     ) -> None:
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.weave: "Weave" = cast("Weave", self.app)
+        self._model_text_cache: dict[str, Text] = {}
 
     def compose(self) -> ComposeResult:
         with Horizontal():
@@ -39,8 +40,13 @@ class AppHeader(Widget):
             model = self.weave.current_model
             yield Label(self._get_model_text(model.display_name or model.name), id="model-label")
 
-    def _get_model_text(self, model_name: str) -> str:
-        return f"[dim]{model_name}[/]"
+    def _get_model_text(self, model_name: str) -> Text:
+        # Styled directly rather than via markup, so nothing is parsed and
+        # brackets in model names are shown as-is.
+        text = self._model_text_cache.get(model_name)
+        if text is None:
+            text = self._model_text_cache[model_name] = Text(model_name, style="dim")
+        return text
 
     def update_model_label(self, model_name: str) -> None:
         model_label = self.query_one("#model-label", Label)
@@ -4,9 +4,11 @@ Main chat widget for conversation display and interaction.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Literal, cast
 
 from textual.widgets import Label
 from textual import on, work, events
@@ -18,6 +20,8 @@ from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
 
+from weave.core.logging import logger
+from weave.llm.chat import format_messages_for_llm
 from weave.tui.chats_manager import ChatsManager
 from weave.tui.models import ChatData, ChatMessage, MessageContent
 from weave.tui.widgets.response_status import ResponseStatus
@@ -30,6 +34,54 @@ if TYPE_CHECKING:
     from weave.tui.app import Weave
 
 
+class TokenBuffer:
+    """Streamed tokens handed from the response worker to the event loop."""
+
+    __slots__ = ("_lock", "_tokens")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: list[str] = []
+
+    def put(self, token: str) -> bool:
+        """Add a token; True if the buffer was empty and needs draining."""
+        with self._lock:
+            self._tokens.append(token)
+            return len(self._tokens) == 1
+
+    def drain(self) -> str:
+        """Take every buffered token, joined."""
+        with self._lock:
+            tokens, self._tokens = self._tokens, []
+        return "".join(tokens)
+
+
+ResponseState = Literal["idle", "streaming", "error"]
+
+
+class ChatContainer(VerticalScroll):
+    """Scrolls the conversation, following new content once it overflows."""
+
+    def watch_virtual_size(self) -> None:
+        self._update_anchor()
+
+    def on_resize(self) -> None:
+        self._update_anchor()
+
+    def _update_anchor(self) -> None:
+        # Anchored, the container follows streamed content in the same frame
+        # it grows, until the user scrolls away from the bottom. Textual
+        # bottom-aligns anchored content that doesn't fill the container, so
+        # short chats stay unanchored.
+        # Not max_scroll_y: container_size is updated after virtual_size.
+        overflowing = self.virtual_size.height > self.scrollable_content_region.height
+        if overflowing != self.is_anchored:
+            self.anchor(overflowing)
+            if not overflowing:
+                # Undo the offset the compositor applied while anchored.
+                self.scroll_home(animate=False, force=True, immediate=True)
+
+
 class ChatPromptInput(PromptInput):
     BINDINGS = [Binding("escape", "app.pop_screen", "Close chat", key_display="esc")]
 
@@ -56,8 +108,11 @@ class Chat(Widget):
         ),
     ]
 
-    allow_input_submit = reactive(True)
-    """Used to lock the chat input while the agent is responding."""
+    LOAD_BATCH_SIZE = 20
+    """Chatboxes mounted per batch when loading a chat."""
+
+    state: reactive[ResponseState] = reactive("idle", init=False)
+    """Where the agent's response is at; input is locked while streaming."""
 
     def __init__(self, chat_data: ChatData) -> None:
         super().__init__()
@@ -65,57 +120,68 @@ class Chat(Widget):
         self.weave: "Weave" = cast("Weave", self.app)
         self.model = chat_data.model
 
-    @dataclass
+    @dataclass(slots=True)
     class AgentResponseStarted(Message):
         pass
 
-    @dataclass
+    @dataclass(slots=True)
     class AgentResponseComplete(Message):
         chat_id: int | None
         message: ChatMessage
         chatbox: Chatbox
 
-    @dataclass
+    @dataclass(slots=True)
     class AgentResponseFailed(Message):
         """Sent when the agent fails to respond."""
         last_message: ChatMessage
 
-    @dataclass
+    @dataclass(slots=True)
     class NewUserMessage(Message):
         content: str
 
+    @dataclass(slots=True)
+    class TokensReceived(Message):
+        """Sent from the response worker when `tokens` goes from empty to non-empty."""
+        chatbox: Chatbox
+        tokens: TokenBuffer
+
     def compose(self) -> ComposeResult:
         yield ResponseStatus()
         yield ChatHeader(chat=self.chat_data, model=self.model)
 
-        with VerticalScroll(id="chat-container") as vertical_scroll:
-            vertical_scroll.can_focus = False
+        with ChatContainer(id="chat-container") as chat_container:
+            chat_container.can_focus = False
+        self._chat_container = chat_container
 
-        yield ChatPromptInput(id="prompt")
+        self._prompt = ChatPromptInput(id="prompt")
+        yield self._prompt
 
     async def on_mount(self, _: events.Mount) -> None:
         """When the component is mounted, load the chat."""
         await self.load_chat(self.chat_data)
 
     @property
-    def chat_container(self) -> VerticalScroll:
-        return self.query_one("#chat-container", VerticalScroll)
+    def chat_container(self) -> ChatContainer:
+        return self._chat_container
 
     @property
     def is_empty(self) -> bool:
         """True if the conversation is empty."""
         return len(self.chat_data.messages) == 1  # Contains system message at first.
 
+    def watch_state(self, state: ResponseState) -> None:
+        # After a failure the prompt is restored, so it can be resent.
+        self._prompt.submit_ready = state != "streaming"
+
     def scroll_to_latest_message(self):
-        container = self.chat_container
-        container.refresh()
-        container.scroll_end(animate=False, force=True)
+        self.chat_container.scroll_end(animate=False, force=True)
 
     @on(AgentResponseFailed)
     def restore_state_on_agent_failure(self, event: Chat.AgentResponseFailed) -> None:
         original_prompt = event.last_message.message.get("content", "")
         if isinstance(original_prompt, str):
-            self.query_one(ChatPromptInput).text = original_prompt
+            self._prompt.text = original_prompt
+        self.state = "error"
 
     async def new_user_message(self, content: str) -> None:
         """Handle a new user message."""
@@ -126,7 +192,7 @@ class Chat(Widget):
         }
 
         user_chat_message = ChatMessage(user_message, now_utc, self.chat_data.model)
-        self.chat_data.messages.append(user_chat_message)
+        self.chat_data.add_message(user_chat_message)
         user_message_chatbox = Chatbox(user_chat_message, self.chat_data.model)
 
         await self.chat_container.mount(user_message_chatbox)
@@ -139,8 +205,7 @@ class Chat(Widget):
                 chat_id=self.chat_data.id, message=user_chat_message
             )
 
-        prompt = self.query_one(ChatPromptInput)
-        prompt.submit_ready = False
+        self.state = "streaming"
         self.stream_agent_response()
 
     @work(thread=True, group="agent_response")
@@ -167,43 +232,35 @@ class Chat(Widget):
         self.post_message(self.AgentResponseStarted())
         self.app.call_from_thread(self.chat_container.mount, response_chatbox)
 
-        import asyncio
-        from weave.llm.chat import format_messages_for_llm
+        # Deferred so that llama.cpp's native library loads on the first
+        # response rather than at startup.
         from weave.llm.client import stream_chat_completion
-        from weave.core.logging import logger
-        
+
         logger.info("Starting agent response stream")
-        logger.debug(f"Chat data has {len(self.chat_data.messages)} messages")
+        logger.debug("Chat data has %d messages", len(self.chat_data.messages))
         
         try:
             logger.info("Formatting messages for LLM")
             formatted_messages = format_messages_for_llm(self.chat_data.messages)
-            logger.debug(f"Formatted messages: {formatted_messages}")
+            logger.debug("Formatted messages: %s", formatted_messages)
             
             logger.info("Calling chat_completion")
             llm_response = stream_chat_completion(formatted_messages)
             logger.info("LLM response generator created, starting iteration")
             
+            tokens = TokenBuffer()
             chunk_count = 0
             for chunk in llm_response:
                 chunk_count += 1
-                logger.debug(f"Received chunk #{chunk_count}: {repr(chunk)}")
-                
-                response_chatbox.border_title = "Agent is responding..."
-                self.app.call_from_thread(
-                    response_chatbox.append_chunk, chunk 
-                )
-                
-                scroll_y = self.chat_container.scroll_y
-                max_scroll_y = self.chat_container.max_scroll_y
-                if scroll_y in range(max_scroll_y - 3, max_scroll_y + 1):
-                    self.app.call_from_thread(
-                        self.chat_container.scroll_end, animate=False
-                    )
-                
-                await asyncio.sleep(0.00005)  # Simulate streaming delay
+                if chunk_count % 100 == 0:
+                    logger.debug("Received %d chunks", chunk_count)
+
+                # Only the first token since the last drain wakes the event
+                # loop; the screen renders everything buffered once per frame.
+                if tokens.put(chunk):
+                    self.post_message(self.TokensReceived(response_chatbox, tokens))
             
-            logger.info(f"Streaming complete. Received {chunk_count} chunks total")
+            logger.info("Streaming complete. Received %d chunks total", chunk_count)
                 
         except Exception as e:
             logger.error(f"Error during streaming: {e}", exc_info=True)
@@ -239,17 +296,16 @@ class Chat(Widget):
     @on(AgentResponseComplete)
     def agent_finished_responding(self, event: AgentResponseComplete) -> None:
         # Ensure the thread is updated with the message from the agent
-        self.chat_data.messages.append(event.message)
+        self.chat_data.add_message(event.message)
         event.chatbox.border_title = "Agent"
         event.chatbox.remove_class("response-in-progress")
-        prompt = self.query_one(ChatPromptInput)
-        prompt.submit_ready = True
+        self.state = "idle"
 
     @on(PromptInput.PromptSubmitted)
     async def user_chat_message_submitted(
         self, event: PromptInput.PromptSubmitted
     ) -> None:
-        if self.allow_input_submit is True:
+        if self.state != "streaming":
             user_message = event.text
             await self.new_user_message(user_message)
 
@@ -261,7 +317,7 @@ class Chat(Widget):
 
     @on(Chatbox.CursorEscapingBottom)
     def move_focus_to_prompt(self) -> None:
-        self.query_one(ChatPromptInput).focus()
+        self._prompt.focus()
 
     @on(TitleStatic.ChatRenamed)
     async def handle_chat_rename(self, event: TitleStatic.ChatRenamed) -> None:
@@ -272,7 +328,11 @@ class Chat(Widget):
             await ChatsManager.rename_chat(event.chat_id, event.new_title)
 
     def get_latest_chatbox(self) -> Chatbox:
-        return self.query(Chatbox).last()
+        # The container only holds chatboxes, in order.
+        chatboxes = self.chat_container.children
+        if not chatboxes:
+            raise NoMatches("No messages in this chat.")
+        return cast(Chatbox, chatboxes[-1])
 
     def focus_latest_message(self) -> None:
         try:
@@ -288,10 +348,9 @@ class Chat(Widget):
         self.focus_latest_message()
 
     def action_focus_first_message(self) -> None:
-        try:
-            self.query(Chatbox).first().focus()
-        except NoMatches:
-            pass
+        chatboxes = self.chat_container.children
+        if chatboxes:
+            chatboxes[0].focus()
 
     def action_scroll_container_up(self) -> None:
         if self.chat_container:
@@ -302,12 +361,25 @@ class Chat(Widget):
             self.chat_container.scroll_down()
 
     async def load_chat(self, chat_data: ChatData) -> None:
-        chatboxes = [
-            Chatbox(chat_message, chat_data.model)
-            for chat_message in chat_data.non_system_messages
-        ]
-        await self.chat_container.mount_all(chatboxes)
-        self.chat_container.scroll_end(animate=False, force=True)
+        container = self.chat_container
+
+        # Mount newest first, a batch at a time, yielding between batches so
+        # long chats paint their latest messages right away and input stays
+        # responsive; older batches are inserted above.
+        # Batches are sliced from `messages` directly rather than copying
+        # `non_system_messages` first; index 0 is the system prompt.
+        messages = chat_data.messages
+        for end in range(len(messages), 1, -self.LOAD_BATCH_SIZE):
+            chatboxes = [
+                Chatbox(chat_message, chat_data.model)
+                for chat_message in messages[max(end - self.LOAD_BATCH_SIZE, 1):end]
+            ]
+            if container.children:
+                await container.mount_all(chatboxes, before=0)
+            else:
+                await container.mount_all(chatboxes)
+            await asyncio.sleep(0)
+
         chat_header = self.query_one(ChatHeader)
         chat_header.update_header(
             chat=chat_data,
@@ -317,8 +389,7 @@ class Chat(Widget):
         # If the last message didn't receive a response, try again.
         messages = chat_data.messages
         if messages and messages[-1].message.get("role") == "user":
-            prompt = self.query_one(ChatPromptInput)
-            prompt.submit_ready = False
+            self.state = "streaming"
             self.stream_agent_response()
 
     def action_close(self) -> None:
@@ -90,7 +90,7 @@ class ChatHeader(Widget):
 
     def title_static_content(self) -> str:
         chat = self.chat
-        content = escape(chat.title or chat.short_preview) if chat else "Empty chat"
+        content = escape(chat.title or chat.preview) if chat else "Empty chat"
         return f"[@click=rename_chat]{content}[/]"
 
     def model_static_content(self) -> str:
@@ -4,8 +4,9 @@ Chat list widget for displaying chat history.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, cast
 
 import humanize
@@ -20,47 +21,64 @@ from textual.widgets import OptionList
 from textual.widgets.option_list import Option
 
 from weave.tui.chats_manager import ChatsManager
-from weave.tui.models import ChatData
+from weave.tui.models import ChatSummary
 
 if TYPE_CHECKING:
     from weave.tui.app import Weave
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatListItemRenderable:
     """Rich renderable for a chat list item."""
-    chat: ChatData
+    chat: ChatSummary
+    _cached: tuple[int, Padding] | None = field(default=None, init=False, repr=False)
+    """The last rendered item and the minute it was built in."""
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         now = datetime.datetime.now(datetime.timezone.utc)
-        delta = now - self.chat.update_time
-        time_ago = humanize.naturaltime(delta)
+        # The summary is immutable, so only the time can change the output;
+        # "time ago" is refreshed at most once a minute.
+        minute = int(now.timestamp()) // 60
+        if self._cached is not None and self._cached[0] == minute:
+            yield self._cached[1]
+            return
+        time_ago = humanize.naturaltime(now - self.chat.update_ts)
         time_ago_text = Text(time_ago, style="dim i")
         model = self.chat.model
         subtitle = f"[dim]{escape(model.display_name or model.name)}"
         if model.provider:
             subtitle += f" [i]via[/] {escape(model.provider)}"
         model_text = Text.from_markup(subtitle)
-        title = self.chat.title or self.chat.short_preview.replace("\n", " ")
-        yield Padding(
+        title = self.chat.title or self.chat.preview
+        padding = Padding(
             Text.assemble(title, "\n", model_text, "\n", time_ago_text),
             pad=(0, 0, 0, 1),
         )
+        self._cached = (minute, padding)
+        yield padding
 
 
 class ChatListItem(Option):
     """Option list item for a chat."""
     
-    def __init__(self, chat: ChatData) -> None:
+    def __init__(self, chat: ChatSummary) -> None:
         super().__init__(ChatListItemRenderable(chat))
         self.chat = chat
 
 
 class ChatList(OptionList):
-    """Widget for displaying a list of chats."""
-    
+    """Widget for displaying a list of chats.
+
+    Chats are loaded a page at a time; the next page is fetched in the
+    background once the highlight or scroll position nears the end.
+    """
+
+    PAGE_SIZE = 50
+    PREFETCH_MARGIN = 10
+    """Rows from the end of the loaded chats at which the next page is fetched."""
+
     BINDINGS = [
         Binding(
             "escape",
@@ -87,7 +105,7 @@ class ChatList(OptionList):
 
     @dataclass
     class ChatOpened(Message):
-        chat: ChatData
+        chat: ChatSummary
 
     class CursorEscapingTop(Message):
         """Cursor attempting to move out-of-bounds at top of list."""
@@ -105,49 +123,78 @@ class ChatList(OptionList):
     ):
         super().__init__(*content, name=name, id=id, classes=classes, disabled=disabled)
         self._chat_items: list[ChatListItem] = []
+        self._loaded_offset = 0
+        """Offset of the next page to load."""
+        self._chat_count = 0
+        self._prefetch_task: asyncio.Task[None] | None = None
 
     async def on_mount(self) -> None:
         await self.reload_and_refresh()
 
     @on(OptionList.OptionSelected)
-    async def post_chat_opened(self, event: OptionList.OptionSelected) -> None:
+    def post_chat_opened(self, event: OptionList.OptionSelected) -> None:
         assert isinstance(event.option, ChatListItem)
-        chat = event.option.chat
-        await self.reload_and_refresh()
-        self.post_message(ChatList.ChatOpened(chat=chat))
+        # Nothing changes until the chat is used; HomeScreen reloads the
+        # list when it resumes.
+        self.post_message(ChatList.ChatOpened(chat=event.option.chat))
 
     @on(OptionList.OptionHighlighted)
     @on(events.Focus)
     def show_border_subtitle(self) -> None:
         if self.highlighted is not None:
             self.border_subtitle = self.get_border_subtitle()
+            if self.highlighted >= self.option_count - self.PREFETCH_MARGIN:
+                self.prefetch_next_page()
         elif self.option_count > 0:
             self.highlighted = 0
 
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if new_value >= self.max_scroll_y - self.PREFETCH_MARGIN:
+            self.prefetch_next_page()
+
     def on_blur(self) -> None:
         self.border_subtitle = None
 
     async def reload_and_refresh(self, new_highlighted: int = -1) -> None:
-        """Reload the chats and refresh the widget."""
-        self._chat_items = await self.load_chat_list_items()
+        """Reload the first page of chats and refresh the widget."""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
+        chats, self._chat_count = await asyncio.gather(
+            ChatsManager.page_chats(0, self.PAGE_SIZE), ChatsManager.count_chats()
+        )
+        self._chat_items = [ChatListItem(chat) for chat in chats]
+        self._loaded_offset = len(chats)
         old_highlighted = self.highlighted
-        self.clear_options()
-        self.add_options(self._chat_items)
+        self.set_options(self._chat_items)
         self.border_title = self.get_border_title()
         if new_highlighted > -1:
             self.highlighted = new_highlighted
-        else:
-            self.highlighted = old_highlighted
+        elif old_highlighted is not None and self._chat_items:
+            self.highlighted = min(old_highlighted, len(self._chat_items) - 1)
 
         self.refresh()
 
-    async def load_chat_list_items(self) -> list[ChatListItem]:
-        chats = await self.load_chats()
-        return [ChatListItem(chat) for chat in chats]
-
-    async def load_chats(self) -> list[ChatData]:
-        all_chats = await ChatsManager.all_chats()
-        return all_chats
+    def prefetch_next_page(self) -> None:
+        """Start loading the next page of chats, unless already loading."""
+        if self._loaded_offset >= self._chat_count:
+            return
+        if self._prefetch_task is None or self._prefetch_task.done():
+            self._prefetch_task = asyncio.create_task(self._load_next_page())
+
+    async def _load_next_page(self) -> None:
+        chats = await ChatsManager.page_chats(self._loaded_offset, self.PAGE_SIZE)
+        if not chats:
+            # Chats were archived elsewhere; the count was stale.
+            self._chat_count = self._loaded_offset
+            return
+        items = [ChatListItem(chat) for chat in chats]
+        self._chat_items.extend(items)
+        self._loaded_offset += len(chats)
+        self.add_options(items)
+        if self.highlighted is not None:
+            self.border_subtitle = self.get_border_subtitle()
 
     async def action_archive_chat(self) -> None:
         if self.highlighted is None:
@@ -156,6 +203,9 @@ class ChatList(OptionList):
         item = cast(ChatListItem, self.get_option_at_index(self.highlighted))
         self._chat_items.pop(self.highlighted)
         self.remove_option_at_index(self.highlighted)
+        # The rows after it shift up by one in the database too.
+        self._loaded_offset -= 1
+        self._chat_count -= 1
 
         chat_id = item.chat.id
         if chat_id is not None:
@@ -170,18 +220,21 @@ class ChatList(OptionList):
         self.refresh()
 
     def get_border_title(self) -> str:
-        return f"History ({len(self._chat_items)})"
+        return f"History ({self._chat_count})"
 
     def get_border_subtitle(self) -> str:
         if self.highlighted is None:
             return ""
-        return f"{self.highlighted + 1} / {self.option_count}"
-
-    def create_chat(self, chat_data: ChatData) -> None:
-        new_chat_list_item = ChatListItem(chat_data)
-        self._chat_items = [new_chat_list_item, *self._chat_items]
-        self.clear_options()
-        self.add_options(self._chat_items)
+        return f"{self.highlighted + 1} / {self._chat_count}"
+
+    def create_chat(self, chat: ChatSummary) -> None:
+        self._chat_items.insert(0, ChatListItem(chat))
+        self._loaded_offset += 1
+        self._chat_count += 1
+        # OptionList can only append, so prepending resets the options,
+        # which measures them once (clear_options would measure twice).
+        self.set_options(self._chat_items)
+        self.border_title = self.get_border_title()
         self.highlighted = 0
         self.refresh()
 
@@ -5,6 +5,7 @@ Chatbox widget for displaying individual messages.
 from __future__ import annotations
 
 import bisect
+import functools
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
@@ -26,6 +27,13 @@ if TYPE_CHECKING:
     from weave.tui.app import Weave
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_markdown(content: str) -> Markdown:
+    # Shared by every Chatbox, so reopening a chat or re-rendering a finished
+    # message reuses the parsed document.
+    return Markdown(content, code_theme="monokai")
+
+
 class SelectionTextArea(TextArea):
     """TextArea with vim-style selection mode."""
     
@@ -268,7 +276,10 @@ class Chatbox(Widget, can_focus=True):
         role = self.message.message.get("role", "user")
         if role == "assistant":
             self.add_class("assistant-message")
-            self.border_title = "Agent"
+            if self.has_class("response-in-progress"):
+                self.border_title = "Agent is responding..."
+            else:
+                self.border_title = "Agent"
         else:
             self.add_class("human-message")
             self.border_title = "You"
@@ -355,7 +366,10 @@ class Chatbox(Widget, can_focus=True):
         content = self.message.message.get("content")
         if not isinstance(content, str):
             content = ""
-        return Markdown(content, code_theme="monokai")
+        if self.has_class("response-in-progress"):
+            # Changes on every flush; caching would only evict finished messages.
+            return Markdown(content, code_theme="monokai")
+        return _parse_markdown(content)
 
     def render(self) -> RenderableType:
         if self.selection_mode:
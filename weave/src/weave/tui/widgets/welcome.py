@@ -2,14 +2,15 @@
 Welcome widget shown on the home screen when no chat history exists.
 """
 
-from rich.console import RenderableType
+from textual.app import RenderResult
+from textual.content import Content
 from textual.widgets import Static
 
 
 class Welcome(Static):
     MESSAGE = """
 To get started, type a message in the box at the top of the
-screen and press [b u]ctrl+j[/] or [b u]alt+enter[/] to send it.
+screen and press [b u]ctrl+e[/] or [b u]alt+enter[/] to send it.
 
 Weave runs entirely on your local machine using llama.cpp.
 No API keys required, no data leaves your computer.
@@ -21,8 +22,11 @@ For help and keyboard shortcuts, press [b u]F1[/] or [b u]?[/].
 
     BORDER_TITLE = "Welcome to Weave!"
 
-    def render(self) -> RenderableType:
-        return self.MESSAGE
+    # Parsed once; Textual markup (rather than Rich's) keeps the @click action.
+    CONTENT = Content.from_markup(MESSAGE)
+
+    def render(self) -> RenderResult:
+        return self.CONTENT
 
     def _action_open_repo(self) -> None:
         import webbrowser
@@ -8,3 +8,27 @@ Verifies:
 - Loop detection and breaking
 """
 
+
+import asyncio
+
+from weave.agent.react import execute_tool_calls
+
+
+class _CancellingRegistry:
+    async def aexecute(self, name, args):
+        if name == "cancelled":
+            raise asyncio.CancelledError()
+        return f"{name} ok"
+
+
+def test_cancelled_tool_call_becomes_error_string():
+    tool_calls = [
+        {"tool_name": "read_file", "arguments": {}},
+        {"tool_name": "cancelled", "arguments": {}},
+    ]
+
+    results = asyncio.run(execute_tool_calls(_CancellingRegistry(), tool_calls))
+
+    assert results[0] == "read_file ok"
+    assert isinstance(results[1], str)
+    assert results[1].startswith('Error executing tool "cancelled"')
@@ -0,0 +1,63 @@
+"""
+Tests for tui.widgets.chat module.
+
+Verifies:
+- Short conversations stay at the top of the chat container
+- Long conversations open scrolled to the latest message
+"""
+import asyncio
+
+from textual import events
+
+from weave.tui.app import Weave
+from weave.tui.models import ChatData, ChatMessage, WeaveModel
+from weave.tui.screens.chat_screen import ChatScreen
+from weave.tui.widgets.chat import Chat
+from weave.tui.widgets.chatbox import Chatbox
+
+MODEL = WeaveModel(id="test", name="test")
+
+
+class ChatApp(Weave):
+    """Opens a single chat, skipping the home screen and its database."""
+
+    def __init__(self, chat_data: ChatData) -> None:
+        super().__init__()
+        self.chat_data = chat_data
+
+    async def on_mount(self, event: events.Mount) -> None:
+        event.prevent_default()
+        self.weave_theme = "cursor"
+        await self.push_screen(ChatScreen(self.chat_data))
+
+
+def _chat_data(exchanges: int) -> ChatData:
+    chat_data = ChatData(id=1, model=MODEL, title="test", create_timestamp=None)
+    chat_data.add_message(ChatMessage({"role": "system", "content": "system"}, None, MODEL))
+    for i in range(exchanges):
+        chat_data.add_message(ChatMessage({"role": "user", "content": f"question {i}"}, None, MODEL))
+        chat_data.add_message(ChatMessage({"role": "assistant", "content": f"answer {i}"}, None, MODEL))
+    return chat_data
+
+
+async def _settled_container(chat_data: ChatData):
+    app = ChatApp(chat_data)
+    async with app.run_test(size=(80, 40)) as pilot:
+        await pilot.pause(0.2)
+        container = app.screen.query_one(Chat).chat_container
+        first_chatbox = container.query(Chatbox).first()
+        return container.scroll_y, container.max_scroll_y, container.region.y, first_chatbox.region.y
+
+
+def test_short_chat_is_top_aligned():
+    scroll_y, _, container_y, first_chatbox_y = asyncio.run(_settled_container(_chat_data(1)))
+
+    assert scroll_y == 0
+    assert first_chatbox_y == container_y
+
+
+def test_long_chat_opens_at_latest_message():
+    scroll_y, max_scroll_y, _, _ = asyncio.run(_settled_container(_chat_data(30)))
+
+    assert max_scroll_y > 0
+    assert scroll_y == max_scroll_y
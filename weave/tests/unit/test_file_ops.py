@@ -8,4 +8,88 @@ Verifies:
 - Path traversal prevention
 - Encoding handling
 """
+import pytest
 
+from weave.tools import file_ops
+from weave.tools.file_ops import _count_lines, get_file_info, search_files
+
+
+def test_search_files_does_not_match_across_lines(tmp_path):
+    (tmp_path / "a.txt").write_text("foo \nbar\nfoo bar\n")
+
+    result = search_files(tmp_path, r"foo\s+bar")
+
+    assert result == "a.txt:3: foo bar"
+
+
+@pytest.mark.parametrize("pattern", [
+    "été", r"\bcaf\b", r"^\w+$", r"\w+ x", "naïve", "[à-ÿ]", r"^last", r"x$", "cafe", r"\s+",
+])
+def test_search_files_hyperscan_matches_re(tmp_path, monkeypatch, pattern):
+    pytest.importorskip("hyperscan")
+    (tmp_path / "unicode.txt").write_bytes("café\nÉTÉ\r\nnaïve x\rlast line\n".encode())
+    (tmp_path / "ascii.txt").write_bytes(b"cafe\rcaf x\r\nlast\n")
+    (tmp_path / "invalid.txt").write_bytes(b"caf\xe9 x\ncafe\n\xff")
+
+    with_hyperscan = search_files(tmp_path, pattern)
+    monkeypatch.setattr(file_ops, "hyperscan", None)
+
+    assert with_hyperscan == search_files(tmp_path, pattern)
+
+
+def test_search_files_pattern_with_directory(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "pkg" / "tests").mkdir(parents=True)
+    (tmp_path / "main.py").write_text("needle\n")
+    (tmp_path / "tests" / "test_a.py").write_text("needle\n")
+    (tmp_path / "pkg" / "tests" / "test_b.py").write_text("needle\n")
+
+    result = search_files(tmp_path, "needle", file_pattern="tests/*.py")
+
+    assert sorted(result.splitlines()) == [
+        "pkg/tests/test_b.py:1: needle",
+        "tests/test_a.py:1: needle",
+    ]
+
+
+def test_search_files_pattern_with_recursive_directory(tmp_path):
+    (tmp_path / "src" / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "src" / "top.py").write_text("needle\n")
+    (tmp_path / "src" / "pkg" / "sub" / "deep.py").write_text("needle\n")
+    (tmp_path / "src" / "pkg" / "notes.txt").write_text("needle\n")
+    (tmp_path / "lib" / "other.py").write_text("needle\n")
+
+    result = search_files(tmp_path, "needle", file_pattern="src/**/*.py")
+
+    assert sorted(result.splitlines()) == [
+        "src/pkg/sub/deep.py:1: needle",
+        "src/top.py:1: needle",
+    ]
+
+
+@pytest.mark.parametrize("content, lines", [
+    (b"", "0"),
+    (b"one\ntwo", "2"),
+    (b"one\ntwo\n", "2"),
+    (b"nul\0inside\n", "1"),
+    (b"caf\xc3\xa9\r\nna\xc3\xafve\rlast", "3"),
+    (b"\xff\xfe\n", "[binary file]"),
+    (b"truncated \xc3", "[binary file]"),
+])
+def test_get_file_info_line_count(tmp_path, content, lines):
+    file = tmp_path / "f.txt"
+    file.write_bytes(content)
+
+    assert f"Lines: {lines}" in get_file_info(file, "f.txt")
+
+
+@pytest.mark.parametrize("content", [b"a\r\nb\r\n", b"a\r\r\nb\n\rc", b"\xc3\xa9\r\n\xc3\xa9"])
+def test_count_lines_matches_text_mode_across_chunks(tmp_path, content):
+    file = tmp_path / "f.txt"
+    file.write_bytes(content)
+    with file.open("r", encoding="utf-8") as f:
+        expected = sum(1 for _ in f)
+
+    for chunk_size in (1, 2, 3, 1 << 20):
+        assert _count_lines(file, chunk_size) == expected